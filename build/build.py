@@ -18,6 +18,7 @@ from circup.commands import main as circup_cli
 # TODO: Append additional asset directories here
 ASSET_DIRS = (
     "bitmaps",
+    "pong",
 )
 
 # TODO: Append additional source files here
@@ -113,7 +114,10 @@ def main():
 
             # copy asset contents
             for asset_dir in asset_dirs:
-                shutil.copytree(asset_dir, bundle_dir / asset_dir.name, dirs_exist_ok=True)
+                shutil.copytree(
+                    asset_dir, bundle_dir / asset_dir.name, dirs_exist_ok=True,
+                    ignore=shutil.ignore_patterns("__pycache__", "*.pyc"),  # left behind by running on the host
+                )
 
             # copy src files
             for src_file in SRC_FILES:
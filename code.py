@@ -12,20 +12,33 @@ if len(__file__.split("/")[:-1]) > 1:
 import audiomixer
 import array
 import asyncio
+import board
 import displayio
+import keypad
+import os
 import random
 import synthio
 import sys
 import supervisor
 from terminalio import FONT
-import vectorio
 
 from adafruit_display_text.label import Label
 import adafruit_fruitjam.peripherals
-import adafruit_usb_host_mouse
 import relic_usb_host_gamepad
 import relic_waveform
 
+from pong import allocs, ansi, audio, inputs, keyboard, physics, replay, score, state
+from pong.audio import SFX_PADDLE, SFX_SCORE, SFX_WALL
+from pong.ai import Computer
+from pong.buttons import Buttons
+from pong.gamepads import Gamepads
+from pong.latency import LatencyMonitor
+from pong.mouse import BUTTON_LEFT, Mouse
+from pong.neopixels import NeoPixelRenderer, Snapshot
+from pong.playfield import BitmapPlayfield, VectorioPlayfield
+from pong.render import Renderer
+from pong.scheduler import FrameScheduler
+
 # get Fruit Jam OS config if available
 try:
     import launcher_config
@@ -37,17 +50,35 @@ except ImportError:
 PADDLE_SPEED = 6
 INITIAL_BALL_SPEED = 1
 BALL_SPEED_MODIFIER = 1.25
+MAX_BALL_SPEED = PADDLE_SPEED
 WIN_SCORE = 11
 WIN_DIFF = 2
-COMPUTER_MIN_TIME = .1
+COMPUTER_MIN_TIME = .1  # reaction time to the ball bouncing
 COMPUTER_MAX_TIME = .4
-
-# setup display
-adafruit_fruitjam.peripherals.request_display_config(320, 240)
+COMPUTER_ERROR = 40  # maximum distance in pixels the computer may misjudge the ball by
+FRAME_RATE = 30  # physics steps per second
+MAX_FRAME_STEPS = 4  # most physics steps to catch up on in a single frame
+NEOPIXEL_RATE = 15  # neopixel updates per second
+INPUT_RATE = 30  # input polls per second
+BUTTONS_IDLE_RATE = 10  # button event checks per second while no buttons are held
+MOUSE_SENSITIVITY = 1  # pixels per count of slow mouse movement
+MOUSE_ACCELERATION = .125  # extra gain per count moved within a single poll
+
+# set PONG_NEOPIXELS = 0 in settings.toml to turn off the neopixel ball position effect
+NEOPIXELS_ENABLED = str(os.getenv("PONG_NEOPIXELS", 1)) != "0"
+
+# set PONG_RECORDING in settings.toml to record inputs to that path, or PONG_REPLAY to the path of a recording to play it back instead of live input
+RECORDING_PATH = os.getenv("PONG_RECORDING")
+REPLAY_PATH = os.getenv("PONG_REPLAY")
+
+# setup display, set PONG_DISPLAY_WIDTH = 640 (or 360, 720) in settings.toml to use a larger display mode
+adafruit_fruitjam.peripherals.request_display_config(int(os.getenv("PONG_DISPLAY_WIDTH", 320)))
 display = supervisor.runtime.display
 
 # setup audio, buttons, and neopixels
 SAMPLE_RATE = 32000
+AUDIO_BACKEND = os.getenv("PONG_AUDIO", "synth")  # "sample" plays pre-rendered sound effects instead
+AUDIO_VOICES = 3  # number of sound effects which can play at once
 peripherals = adafruit_fruitjam.peripherals.Peripherals(
     safe_volume_limit=(config.audio_volume_override_danger if config is not None else 12),
     sample_rate=SAMPLE_RATE,
@@ -63,22 +94,15 @@ else:
 
 # create sound effects
 if peripherals.audio:
-    # set up synthesizer
-    synth = synthio.Synthesizer(
-        sample_rate=SAMPLE_RATE,
-        channel_count=1,
-    )
-
-    # set up mixer
+    # set up mixer, the synthesizer only needs one voice since it plays every note itself
     mixer = audiomixer.Mixer(
-        voice_count=1,
+        voice_count=(AUDIO_VOICES if AUDIO_BACKEND == "sample" else 1),
         sample_rate=SAMPLE_RATE,
         channel_count=1,
     )
 
-    # play synthesizer through mixer and audio output
+    # play mixer through audio output
     peripherals.audio.play(mixer)
-    mixer.play(synth)
 
     # original pong game can only generate square waves at a one frequency and +1 octave up
     FREQUENCY = 245
@@ -86,35 +110,60 @@ if peripherals.audio:
         (relic_waveform.square(size=64), .8),  # primary sound is a square wave
         (relic_waveform.noise(size=64), .2),  # add a little bit of noise into the mix for more authenticity
     )  # using size to "tune" noise
-    LFO_WAVEFORM = array.array('h', [32767, 32767, 0, 0])
-    def generate_note(duration: float, octave: int = 0, amplitude: float = 1) -> synthio.Note:
-        return synthio.Note(
-            frequency=FREQUENCY * pow(2, octave),
-            waveform=WAVEFORM,
-            envelope=synthio.Envelope(
-                attack_time=0.01, attack_level=1, decay_time=0,
-                sustain_level=1, release_time=0,
-            ),
-            amplitude=synthio.LFO(
-                waveform=LFO_WAVEFORM,
-                scale=amplitude,  # should be full amplitude for first half and and 0 for second
-                rate=1/(duration*2),  # .04s is our duration, doubled for second half of square wave
-                interpolate=False, once=True,
-            ),
-        )
-    
+
     # all of these values are based on the original pong arcade audio
-    SFX_WALL = generate_note(.016)
-    SFX_PADDLE = generate_note(.032, 1)
-    SFX_SCORE = generate_note(.51)
+    SFX_DURATIONS = (.016, .032, .51)  # wall, paddle, and score
+    SFX_OCTAVES = (0, 1, 0)
+
+    if AUDIO_BACKEND == "sample":
+        # render each sound effect once and play them back directly through the mixer
+        sfx = audio.SampleBackend(mixer, tuple(
+            audio.render(WAVEFORM, FREQUENCY * pow(2, octave), duration, SAMPLE_RATE)
+            for duration, octave in zip(SFX_DURATIONS, SFX_OCTAVES)
+        ))
+
+    else:
+        # set up synthesizer
+        synth = synthio.Synthesizer(
+            sample_rate=SAMPLE_RATE,
+            channel_count=1,
+        )
+
+        # play synthesizer through mixer
+        mixer.play(synth)
+
+        LFO_WAVEFORM = array.array('h', [32767, 32767, 0, 0])
+        def generate_note(duration: float, octave: int = 0, amplitude: float = 1) -> synthio.Note:
+            return synthio.Note(
+                frequency=FREQUENCY * pow(2, octave),
+                waveform=WAVEFORM,
+                envelope=synthio.Envelope(
+                    attack_time=0.01, attack_level=1, decay_time=0,
+                    sustain_level=1, release_time=0,
+                ),
+                amplitude=synthio.LFO(
+                    waveform=LFO_WAVEFORM,
+                    scale=amplitude,  # should be full amplitude for first half and and 0 for second
+                    rate=1/(duration*2),  # .04s is our duration, doubled for second half of square wave
+                    interpolate=False, once=True,
+                ),
+            )
+
+        # every voice gets its own copy of each note so that they can overlap
+        sfx = audio.SynthBackend(synth, tuple(
+            tuple(generate_note(duration, octave) for duration, octave in zip(SFX_DURATIONS, SFX_OCTAVES))
+            for i in range(AUDIO_VOICES)
+        ))
+
+    # sound effects are queued during the frame and started by their own task
+    audio_scheduler = audio.Scheduler(sfx, SFX_DURATIONS)
 
 else:
-    SFX_WALL = SFX_SCORE = SFX_PADDLE = None
+    audio_scheduler = None
 
-def play_sfx(note: synthio.Note) -> None:
-    if peripherals.audio:
-        note.amplitude.retrigger()  # make sure we reset our amplitude lfo
-        synth.release_all_then_press(note)  # we only want to play one sound at a time
+def play_sfx(effect: int) -> None:
+    if audio_scheduler is not None:
+        audio_scheduler.post(effect)
 
 # create root group
 root_group = displayio.Group()
@@ -124,26 +173,37 @@ display.root_group = root_group
 foreground_palette = displayio.Palette(1)
 foreground_palette[0] = 0xffffff
 
+# draw the playfield with vectorio shapes, or set PONG_RENDERER = "bitmap" in settings.toml to draw it into a single bitmap
+if os.getenv("PONG_RENDERER", "vectorio") == "bitmap":
+    playfield = BitmapPlayfield(root_group, display.width, display.height, foreground_palette[0])
+else:
+    playfield = VectorioPlayfield(root_group, display.width, display.height, foreground_palette[0])
+
+# refresh the display ourselves once each frame is complete instead of whenever auto refresh happens to run
+renderer = Renderer(display, FRAME_RATE, playfield)
+
 # center line
-root_group.append(vectorio.Rectangle(
-    pixel_shader=foreground_palette,
-    width=2, height=display.height,
-    x=display.width//2-1, y=0,
-))
+playfield.rectangle(display.width//2-1, 0, 2, display.height)
+
+# pre-render the score digits once, set PONG_SCORE_STYLE = "segments" in settings.toml for arcade style digits
+score_palette = displayio.Palette(2)
+score_palette[1] = foreground_palette[0]
+score_palette.make_transparent(0)
+if os.getenv("PONG_SCORE_STYLE", "font") == "segments":
+    score_sheet = score.segment_sheet(16, 28, 4)
+else:
+    score_sheet = score.font_sheet(FONT, 2)
 
 # labels
-score_labels = []
+score_displays = []
 win_labels = []
 for i in range(2):
     x = display.width*(1+i*2)//4
 
     # add score
-    label = Label(
-        font=FONT, text="0", color=foreground_palette[0], scale=2,
-        anchor_point=(.5, 0), anchored_position=(x, 4),
-    )
-    root_group.append(label)
-    score_labels.append(label)
+    score_display = score.ScoreDisplay(score_sheet, score_palette, x, 4)
+    root_group.append(score_display.tilegrid)
+    score_displays.append(score_display)
 
     # add win text
     label = Label(
@@ -157,26 +217,21 @@ for i in range(2):
 # paddles
 paddles = []
 for i in range(2):
-    paddle = vectorio.Rectangle(
-        pixel_shader=foreground_palette,
-        width=4, height=32,
-        x=(display.width-20 if i else 16),
-        y=display.height//2-8,
+    paddle = playfield.rectangle(
+        (display.width-20 if i else 16), display.height//2-8,  # x, y
+        4, 32,  # width, height
     )
-    root_group.append(paddle)
     paddles.append(paddle)
 
 # ball
-ball = vectorio.Rectangle(
-    pixel_shader=foreground_palette,
-    width=8, height=8,
-    x=display.width//2-4, y=display.height//2-4,
+ball = playfield.rectangle(
+    display.width//2-4, display.height//2-4,  # x, y
+    8, 8,  # width, height
 )
 ball.hidden = True  # start out hidden
 if peripherals.neopixels:  # clear ball position on neopixels
     peripherals.neopixels.fill(0)
     peripherals.neopixels.show()
-root_group.append(ball)
 
 # paddle movement method
 def paddle_move(direction: int, player: int = 0) -> None:
@@ -186,250 +241,410 @@ def paddle_move(direction: int, player: int = 0) -> None:
     y = min(max(y, 0), display.height - paddle.height)  # clamp the position to the playfield
     paddles[player].y = y  # update rectangle position
 
-# global variable to indicate that we are waiting for user input
-waiting = False
-async def wait_input() -> None:
-    global waiting
-    waiting = True
-    while waiting:
-        await asyncio.sleep(.5)
-
-# mouse control
-async def mouse_task() -> None:
-    global waiting
-    while True:
-        if (mouse := adafruit_usb_host_mouse.find_and_init_boot_mouse("bitmaps/cursor.bmp")) is not None:
-            mouse.y = display.height // 2
-
-            timeouts = 0
-            previous_pressed_btns = []
-            while timeouts < 9999:
-                pressed_btns = mouse.update()
-
-                # restrict mouse x position to paddle
-                mouse.x = paddles[0].x + paddles[0].width // 2
-
-                # limit mouse y position
-                if mouse.y < paddles[0].height // 2:
-                    mouse.y = paddles[0].height // 2
-                elif mouse.y > display.height - paddles[0].height // 2:
-                    mouse.y = display.height - paddles[0].height // 2
-                
-                # assign mouse position to paddle
-                paddles[0].y = mouse.y - paddles[0].height // 2
-
-                if pressed_btns is None:
-                    timeouts += 1
-                else:
-                    timeouts = 0
-                    if waiting and "left" in pressed_btns and (previous_pressed_btns is None or "left" not in previous_pressed_btns):
-                        waiting = False
-                previous_pressed_btns = pressed_btns
-                await asyncio.sleep(1/30)
-        await asyncio.sleep(1)
-
-async def keyboard_task() -> None:
-    global waiting
-
-    # flush input buffer
-    while supervisor.runtime.serial_bytes_available:
-        sys.stdin.read(1)
+# game state machine which the input sources publish to
+game = state.GameState()
+
+# paddle movement requested by the input sources while the ball is in play, applied once per physics step
+intents = inputs.Intents()
+
+def apply_intents() -> None:
+    for player in range(len(paddles)):
+        if intents.target[player] >= 0:
+            paddles[player].y = intents.target[player]
+        elif intents.direction[player]:
+            paddle_move(intents.direction[player], player)
+    intents.clear()
+
+# time from reading paddle input to drawing the moved paddle for each input source
+latency = LatencyMonitor()
+
+# set PONG_PROFILE = 1 in settings.toml to count the heap allocations made in each part of the gameplay frame
+allocations = allocs.AllocationMonitor() if str(os.getenv("PONG_PROFILE", 0)) != "0" and allocs.AVAILABLE else None
+
+# every input is applied through here so that it can be recorded and replayed
+def handle_input(source: int, action: int, value: int = 0, player: int = 0) -> None:
+    if recorder is not None:
+        recorder.record(source, action, value, player)
+    if replay_player is None and game.state == state.RALLY and action <= inputs.POSITION:  # only time live input
+        latency.read(source, supervisor.ticks_ms())
+    if action == inputs.MOVE:
+        if game.state == state.RALLY:
+            intents.move(player, value)
+        else:
+            paddle_move(value, player)
+            renderer.invalidate()
+    elif action == inputs.POSITION:
+        if game.state == state.RALLY:
+            intents.position(player, value)
+        else:
+            paddles[player].y = value
+            renderer.invalidate()
+    elif action == inputs.CONTINUE:
+        game.resume()
+    elif action == inputs.CONNECT:
+        gamepad_connected[player] = bool(value)
+    elif action == inputs.EXIT:
+        if recorder is not None:
+            recorder.flush()
+        peripherals.deinit()
+        supervisor.reload()
+
+# mouse control, motion is added up over every report since the last poll and accelerated
+mouse = Mouse(MOUSE_SENSITIVITY, MOUSE_ACCELERATION)
+
+def poll_mouse() -> bool:
+    if not mouse.update():
+        return False
 
-    while True:
-        while (c := supervisor.runtime.serial_bytes_available) > 0:
-            key = sys.stdin.read(c)
-            if key == "\x1b[A" or key == "\x1b[D":  # up or left
-                paddle_move(1)
-            elif key == "\x1b[B" or key == "\x1b[C":  # down or right
-                paddle_move(-1)
-            elif waiting and (key == "\n" or key == " "):  # enter or space
-                waiting = False
-            elif key == "\x1b":  # escape
-                peripherals.deinit()
-                supervisor.reload()
-        await asyncio.sleep(1/30)
-
-# initialize left and right player gamepads
-gamepads = [relic_usb_host_gamepad.Gamepad(port=i+1) for i in range(2)]
+    # move the paddle relative to where it is or is already headed
+    if mouse.motion:
+        base = intents.target[0] if intents.target[0] >= 0 else paddles[0].y
+        y = min(max(base + mouse.motion, 0), display.height - paddles[0].height)
+        if y != base:  # a move back to where the paddle already is still replaces the pending target
+            handle_input(inputs.MOUSE, inputs.POSITION, y)
 
-async def gamepad_task() -> None:
-    global waiting
-    while True:
-        for i, gamepad in enumerate(gamepads):
-            if gamepad.update():
-                if gamepad.buttons.UP or gamepad.buttons.JOYSTICK_UP:  # up
-                    paddle_move(1, player=i)
-                elif gamepad.buttons.DOWN or gamepad.buttons.JOYSTICK_DOWN:  # down
-                    paddle_move(-1, player=i)
-                if waiting and (gamepad.buttons.A or gamepad.buttons.START):  # A or X on DS4
-                    waiting = False
-                if gamepad.buttons.HOME:  # home
-                    peripherals.deinit()
-                    supervisor.reload()
-        await asyncio.sleep(1/30 if any(gamepad.connected for gamepad in gamepads) else 1)  # sleep longer if there are no gamepads connected
-
-async def buttons_task() -> None:
-    global waiting
-    while True:
-        if peripherals.button3:  # up
-            paddle_move(1)
-        elif peripherals.button1:  # down
-            paddle_move(-1)
-        if waiting and peripherals.button2:  # continue
-            waiting = False
-        if peripherals.button1 and peripherals.button2 and peripherals.button3:  # all buttons = exit
-            peripherals.deinit()
-            supervisor.reload()
-        await asyncio.sleep(1/30)
+    if game.waiting and mouse.clicked & BUTTON_LEFT:
+        handle_input(inputs.MOUSE, inputs.CONTINUE)
+    return True
 
-def get_random_velocity() -> tuple:  # returns (-1 or 1, -1 or 1)
-    return (
-        random.randint(0, 1) * 2 - 1,  # either -1 or 1
-        random.randint(0, 1) * 2 - 1
-    )
+# flush input buffer
+while supervisor.runtime.serial_bytes_available:
+    sys.stdin.read(1)
+
+# serial input is parsed a byte at a time so that no keys are lost when several arrive at once
+keyboard_parser = ansi.Parser()
+
+def handle_key(key: int) -> None:
+    if key == ansi.KEY_UP or key == ansi.KEY_LEFT:
+        handle_input(inputs.KEYBOARD, inputs.MOVE, 1)
+    elif key == ansi.KEY_DOWN or key == ansi.KEY_RIGHT:
+        handle_input(inputs.KEYBOARD, inputs.MOVE, -1)
+    elif game.waiting and (key == ansi.KEY_ENTER or key == ansi.KEY_SPACE):
+        handle_input(inputs.KEYBOARD, inputs.CONTINUE)
+    elif key == ansi.KEY_ESCAPE:
+        handle_input(inputs.KEYBOARD, inputs.EXIT)
+    elif key == ord("l"):  # print input latency to the serial console
+        latency.report()
+    elif key == ord("f"):  # print frame pacing and display refresh stats to the serial console
+        frame_scheduler.report()
+        renderer.report()
+    elif key == ord("a") and allocations is not None:  # print heap allocations per frame to the serial console
+        allocations.report()
+    elif key == ord("s") and audio_scheduler is not None:  # print sound effect stats to the serial console
+        audio_scheduler.report()
+    elif key == ord("r") and recorder is not None:  # print recording stats to the serial console
+        recorder.report()
+
+def poll_keyboard() -> bool:
+    now = supervisor.ticks_ms()
+    while (c := supervisor.runtime.serial_bytes_available) > 0:
+        data = sys.stdin.read(c)
+        for i in range(len(data)):
+            if key := keyboard_parser.feed(ord(data[i]), now):
+                handle_key(key)
+    if key := keyboard_parser.expire(now):  # escape on its own
+        handle_key(key)
+    return True
 
-def collides(a: vectorio.Rectangle, b: vectorio.Rectangle) -> bool:
-    # if one rectangle is to the right of the other
-    if a.x > b.x + b.width or b.x > a.x + a.width:
+# usb keyboard control
+usb_keyboard = None
+
+def poll_usb_keyboard() -> bool:
+    global usb_keyboard
+    if usb_keyboard is None and (usb_keyboard := keyboard.find_and_init_boot_keyboard()) is None:
         return False
-    # if one rectangle is above the other
-    if a.y > b.y + b.height or b.y > a.y + a.height:
+    if not usb_keyboard.update():  # look for the keyboard again
+        usb_keyboard = None
         return False
-    # rectangles must intersect
+
+    # move every frame while a key is held
+    if (usb_keyboard.held(keyboard.KEY_UP) or usb_keyboard.held(keyboard.KEY_LEFT)
+            or usb_keyboard.held(keyboard.KEY_W) or usb_keyboard.held(keyboard.KEY_A)):
+        handle_input(inputs.KEYBOARD, inputs.MOVE, 1)
+    elif (usb_keyboard.held(keyboard.KEY_DOWN) or usb_keyboard.held(keyboard.KEY_RIGHT)
+            or usb_keyboard.held(keyboard.KEY_S) or usb_keyboard.held(keyboard.KEY_D)):
+        handle_input(inputs.KEYBOARD, inputs.MOVE, -1)
+    if game.waiting and (usb_keyboard.pressed(keyboard.KEY_ENTER) or usb_keyboard.pressed(keyboard.KEY_SPACE)):
+        handle_input(inputs.KEYBOARD, inputs.CONTINUE)
+    if usb_keyboard.pressed(keyboard.KEY_ESCAPE):
+        handle_input(inputs.KEYBOARD, inputs.EXIT)
     return True
 
-def apply_brightness(value:int, brightness:float) -> int:
-    for i in range(3):
-        c = (value >> (8 * i)) & 0xff  # extract color component (rgb)
-        c = int(c * brightness)  # apply brightness
-        c = min(max(c, 0x00), 0xff)  # clamp value to acceptable range
-        value &= 0xffffff ^ (0xff << (8 * i))  # remove old component value
-        value |= c << (8 * i)  # insert new component value
-    return value
+# initialize left and right player gamepads, which are looked for in the background
+gamepads = [relic_usb_host_gamepad.Gamepad(port=i+1) for i in range(2)]
+gamepad_manager = Gamepads(gamepads)
+
+# whether each player's gamepad is connected as far as the game knows, changes go through
+# handle_input so that a replay knows when the computer was playing without any gamepads
+gamepad_connected = [False, False]
+
+def poll_gamepads() -> bool:
+    gamepad_manager.update()  # read every report which has arrived since the last poll
+    for i, gamepad in enumerate(gamepads):
+        if gamepad.connected != gamepad_connected[i]:
+            handle_input(inputs.GAMEPAD, inputs.CONNECT, int(gamepad.connected), player=i)
+        if gamepad.connected:
+            if gamepad.buttons.UP or gamepad.buttons.JOYSTICK_UP:  # up
+                handle_input(inputs.GAMEPAD, inputs.MOVE, 1, player=i)
+            elif gamepad.buttons.DOWN or gamepad.buttons.JOYSTICK_DOWN:  # down
+                handle_input(inputs.GAMEPAD, inputs.MOVE, -1, player=i)
+            if game.waiting and (gamepad.buttons.A or gamepad.buttons.START):  # A or X on DS4
+                handle_input(inputs.GAMEPAD, inputs.CONTINUE, player=i)
+            if gamepad.buttons.HOME:  # home
+                handle_input(inputs.GAMEPAD, inputs.EXIT, player=i)
+    return True  # keep polling at full rate so that newly found gamepads respond right away
+
+# scan the buttons in the background so that short presses aren't missed, otherwise read them
+# through the peripherals helper as long as it still holds their pins
+buttons = None
+peripheral_buttons = peripherals._buttons is not None  # None on boards without buttons
+if peripheral_buttons and hasattr(keypad, "Keys") and all(hasattr(board, name) for name in ("BUTTON1", "BUTTON2", "BUTTON3")):
+    for pin in peripherals._buttons:  # release the button pins from the peripherals helper
+        pin.deinit()
+    peripheral_buttons = False
+    try:
+        buttons = Buttons(
+            keypad.Keys((board.BUTTON1, board.BUTTON2, board.BUTTON3), value_when_pressed=False, pull=True),
+            chords=(0b111,),  # all buttons = exit
+        )
+    except ValueError:
+        pass  # the pins are claimed elsewhere, go without buttons rather than read released pins
+
+def poll_buttons() -> bool:
+    if not buttons.update():
+        return False  # nothing is happening, the events will wait for us
+    if buttons.active(2):  # up
+        handle_input(inputs.BUTTONS, inputs.MOVE, 1)
+    elif buttons.active(0):  # down
+        handle_input(inputs.BUTTONS, inputs.MOVE, -1)
+    if game.waiting and buttons.pressed & 0b010:  # continue
+        handle_input(inputs.BUTTONS, inputs.CONTINUE)
+    if buttons.chord(0):
+        handle_input(inputs.BUTTONS, inputs.EXIT)
+    return True
 
-computer_move = 0
-async def gameplay_task() -> None:
-    global computer_move
+def poll_peripheral_buttons() -> bool:
+    if peripherals.button3:  # up
+        handle_input(inputs.BUTTONS, inputs.MOVE, 1)
+    elif peripherals.button1:  # down
+        handle_input(inputs.BUTTONS, inputs.MOVE, -1)
+    if game.waiting and peripherals.button2:  # continue
+        handle_input(inputs.BUTTONS, inputs.CONTINUE)
+    if peripherals.button1 and peripherals.button2 and peripherals.button3:  # all buttons = exit
+        handle_input(inputs.BUTTONS, inputs.EXIT)
+    return True
 
-    # wait for initial input
-    await wait_input()
+def get_random_velocity() -> tuple:  # returns (-1 or 1, -1 or 1)
+    return (
+        random.randint(0, 1) * 2 - 1,  # either -1 or 1
+        random.randint(0, 1) * 2 - 1
+    )
 
-    # show the ball
-    ball.hidden = False
+# only update the neopixels when the quantized ball position changes
+neopixel_renderer = NeoPixelRenderer(peripherals.neopixels, foreground_palette[0], display.width) if peripherals.neopixels else None
+if neopixel_renderer is not None:
+    neopixel_renderer.enabled = NEOPIXELS_ENABLED
 
-    ball_x, ball_y = ball.x, ball.y
-    velocity_x, velocity_y = get_random_velocity()  # start with random velocity
-    ball_speed = INITIAL_BALL_SPEED
-    while True:
+# ball position shared with the neopixel task
+ball_snapshot = Snapshot(ball.x)
 
-        # apply velocity to ball position
-        ball_x += velocity_x * ball_speed
-        ball_y += velocity_y * ball_speed
-        ball.x, ball.y = int(ball_x), int(ball_y)
-
-        # only check if we've hit the bottom if y velocity is positive and if we've hit the top if y velocity is negative
-        if (velocity_y < 0 and ball.y <= 0) or (velocity_y > 0 and ball.y + ball.height >= display.height):
-            velocity_y *= -1  # invert y velocity
-            play_sfx(SFX_WALL)
-        
-        # see if we've collided with a paddle
-        if (velocity_x < 0 and collides(ball, paddles[0])) or (velocity_x > 0 and collides(ball, paddles[1])):
-            velocity_x *= -1  # invert x velocity
-            ball_speed = min(ball_speed * BALL_SPEED_MODIFIER, PADDLE_SPEED)  # increase ball speed by modifier
-            play_sfx(SFX_PADDLE)
-
-        # control computer player if gamepad isn't connected
-        if not gamepads[1].connected and computer_move != 0:
-            paddle_move(computer_move, 1)
+# fixed-point ball state so that physics steps don't allocate floats
+ball_physics = physics.BallPhysics(ball, display.height, INITIAL_BALL_SPEED, BALL_SPEED_MODIFIER, MAX_BALL_SPEED)
 
-        # light up neopixel based on ball position
-        if peripherals.neopixels:
-            # determine ball float position from 0 to n-1
-            pos = ball.x / display.width * (peripherals.neopixels.n - 1)
-            for i in range(peripherals.neopixels.n):
-                # calculate difference from current index to ball position
-                diff = abs(pos - i)
-                # apply foreground color brightness based on distance to ball position
-                peripherals.neopixels[i] = apply_brightness(foreground_palette[0], 1 - diff) if diff < 1 else 0
-            peripherals.neopixels.show()
-
-        # check if we've gone out of bounds
-        if (velocity_x < 0 and ball.x + ball.width < 0) or (velocity_x > 0 and ball.x >= display.width):
-
-            # hide ball
-            ball.hidden = True
-            if peripherals.neopixels:
-                peripherals.neopixels.fill(0)
-                peripherals.neopixels.show()
-
-            # add to player score depending on x velocity direction
-            player = int(velocity_x < 0)  # use velocity boolean as int of 0 or 1
-            score = int(score_labels[player].text)  # obtain current score from label text string
-            score += 1  # increment player score
-            score_labels[player].text = str(score)  # update score label but keep integer variable for later checks
-
-            play_sfx(SFX_SCORE)
-
-            # check if we are above the minimum win score
-            if score >= WIN_SCORE:
-                # check if we are at least 2 points above the other player
-                other_player = 1 - player  # invert player index
-                other_score = int(score_labels[other_player].text)  # obtain other player's score form label text string
-                if score - other_score >= WIN_DIFF:
-                    # show win label
-                    win_labels[player].hidden = False
-
-                    # wait for user input
-                    await wait_input()
-
-                    # hide win label
-                    win_labels[player].hidden = True
-
-                    # reset scores
-                    for label in score_labels:
-                        label.text = "0"
-            
-            else:
-                # delay before showing ball again and continuing
-                await asyncio.sleep(1)
-
-            # reset ball position to center
-            ball.x = (display.width - ball.width) // 2
-            ball.y = (display.height - ball.height) // 2
-            ball_x, ball_y = ball.x, ball.y
+# computer player predicts where the ball will meet its paddle
+computer = Computer(
+    paddles[1], ball_physics, display.width, display.height,
+    COMPUTER_MIN_TIME, COMPUTER_MAX_TIME, COMPUTER_ERROR, PADDLE_SPEED, FRAME_RATE,
+)
 
-            # randomize velocity
-            velocity_x, velocity_y = get_random_velocity()
+# fixed timestep scheduler so ball speed doesn't depend on the load of the other tasks
+frame_scheduler = FrameScheduler(FRAME_RATE, MAX_FRAME_STEPS)
 
-            # reset ball speed
-            ball_speed = INITIAL_BALL_SPEED
+# play back a recording or record live input along with the random seed, stamped with the physics step
+if REPLAY_PATH:
+    recorder = None
+    replay_player = replay.Player(frame_scheduler, REPLAY_PATH)
+else:
+    recorder = replay.Recorder(frame_scheduler, RECORDING_PATH) if RECORDING_PATH else None
+    replay_player = None
 
-            # show the ball
-            ball.hidden = False
+async def gameplay_task() -> None:
+    while True:
+        # wait for a player to start or continue
+        await game.wait(state.SERVE)
+
+        # reset ball position to center, randomize velocity, and reset ball speed
+        ball_physics.reset(
+            (display.width - ball.width) // 2,
+            (display.height - ball.height) // 2,
+            get_random_velocity(),
+        )
+        computer.reset()
+        computer.notify(frame_scheduler.steps)
+        ball_snapshot.reset(ball.x)
+
+        # show the ball
+        ball.hidden = False
+
+        # don't try to catch up on the time spent paused
+        frame_scheduler.reset()
+        game.set(state.RALLY)
+        renderer.owned = True  # draw every frame from here on
+        if recorder is not None:
+            recorder.hold = True  # don't write to the filesystem mid-frame
+
+        while game.state == state.RALLY:
+
+            # run every physics step which has come due since the last frame
+            steps = await frame_scheduler.wait()
+            if allocations is not None:  # made by the other tasks since the last frame
+                allocations.mark(allocs.TASKS)
+            for step in range(frame_scheduler.steps - steps, frame_scheduler.steps):
+
+                # move the paddles as requested by the input sources
+                if replay_player is not None:  # recorded input is applied on the same step as it was live
+                    replay_inputs(step)
+                apply_intents()
+                latency.applied(supervisor.ticks_ms())
+                if allocations is not None:
+                    allocations.mark(allocs.INPUT)
+
+                # move the ball and bounce it off of the paddles and walls
+                events = ball_physics.step(paddles)
+                if events & physics.HIT_PADDLE:
+                    play_sfx(SFX_PADDLE)
+                if events & physics.HIT_WALL:
+                    play_sfx(SFX_WALL)
+                if events:  # the ball has changed direction
+                    computer.notify(step)
+                if allocations is not None:
+                    allocations.mark(allocs.PHYSICS)
+
+                # control computer player if gamepad isn't connected, once it has had a moment to react
+                computer.update(step)
+                if not gamepad_connected[1] and (direction := computer.direction()):
+                    paddle_move(direction, 1)
+                if allocations is not None:
+                    allocations.mark(allocs.COMPUTER)
+
+                # check if we've gone out of bounds
+                if (ball_physics.velocity_x < 0 and ball.x + ball.width < 0) or (ball_physics.velocity_x > 0 and ball.x >= display.width):
+                    game.set(state.POINT)
+                    break
+
+            # publish ball position for the neopixel task
+            ball_snapshot.update(ball.x)
+
+            # draw the frame now that everything has moved
+            renderer.frame(steps)
+            latency.shown(supervisor.ticks_ms())
+            if allocations is not None:
+                allocations.mark(allocs.RENDER)
+                allocations.frame()
+
+        # hide ball
+        ball.hidden = True
+        renderer.owned = False
+        if recorder is not None:
+            recorder.hold = False
+
+        # add to player score depending on x velocity direction
+        player = int(ball_physics.velocity_x < 0)  # use velocity boolean as int of 0 or 1
+        player_score = game.point(player)
+        score_displays[player].show(player_score)  # only swaps tiles
+        renderer.invalidate()
+
+        play_sfx(SFX_SCORE)
+
+        # save recorded input at every point
+        if recorder is not None:
+            recorder.flush()
+
+        # check if we are above the minimum win score and at least 2 points above the other player
+        if player_score >= WIN_SCORE and player_score - game.scores[1 - player] >= WIN_DIFF:
+            # show win label
+            win_labels[player].hidden = False
+            renderer.invalidate()
+
+            # wait for user input
+            game.set(state.WIN)
+            await game.wait(state.SERVE)
+
+            # hide win label
+            win_labels[player].hidden = True
+
+            # reset scores
+            game.reset_scores()
+            for score_display in score_displays:
+                score_display.show(0)
 
-        await asyncio.sleep(1/30)
+        else:
+            # delay before showing ball again and continuing
+            await asyncio.sleep(1)
+            game.set(state.SERVE)
 
-async def computer_task() -> None:
-    global waiting, computer_move
-    paddle = paddles[1]
+async def neopixel_task() -> None:
     while True:
-        if waiting or 0 < ball.y - paddle.y < paddle.height:  # if gameplay has stopped or we're facing the ball
-            computer_move = 0
-        else:
-            computer_move = int(ball.y < paddle.y) * 2 - 1  # should be 1 if ball is below or -1 if ball is above
-        await asyncio.sleep(random.random() * (COMPUTER_MAX_TIME - COMPUTER_MIN_TIME) + COMPUTER_MIN_TIME)
+        # stay dark until the ball is in play
+        neopixel_renderer.clear()
+        await game.wait(state.RALLY)
+
+        # light up neopixel based on ball position
+        while game.state == state.RALLY:
+            if neopixel_renderer.enabled:
+                neopixel_renderer.render(ball_snapshot.position())
+            else:
+                neopixel_renderer.clear()
+            await asyncio.sleep(1/NEOPIXEL_RATE)
+
+def replay_inputs(frame: int) -> None:
+    # apply every recorded input up to the given physics step
+    while replay_player.due(frame):
+        if replay_player.action == inputs.CONTINUE and not game.waiting:
+            break  # hold off until the game is waiting for input like it was when recorded
+        source, action, value, player = replay_player.pop()
+        if action != inputs.NONE:
+            handle_input(source, action, value, player)
+
+def poll_replay() -> bool:
+    # the gameplay task replays input while the ball is in play
+    if game.state != state.RALLY:
+        replay_inputs(frame_scheduler.steps)
+    return not replay_player.finished
+
+# every input source is polled from a single task
+input_mux = inputs.Multiplexer()
+if replay_player is not None:  # replace live input with the recording
+    input_mux.add(poll_replay, FRAME_RATE * 2, 1)
+else:
+    input_mux.add(poll_mouse, INPUT_RATE, 1)
+    input_mux.add(poll_keyboard, INPUT_RATE)
+    input_mux.add(poll_usb_keyboard, INPUT_RATE, 1)
+    input_mux.add(poll_gamepads, INPUT_RATE)
+    if buttons is not None:
+        input_mux.add(poll_buttons, INPUT_RATE, BUTTONS_IDLE_RATE)
+    elif peripheral_buttons:
+        input_mux.add(poll_peripheral_buttons, INPUT_RATE)
+
+async def input_task() -> None:
+    await input_mux.run()
 
 async def main() -> None:
+    tasks = [input_task(), renderer.run()]
+    if replay_player is None:
+        tasks.append(gamepad_manager.discover())
+    if neopixel_renderer is not None:
+        tasks.append(neopixel_task())
+    if audio_scheduler is not None:
+        tasks.append(audio_scheduler.run())
     await asyncio.gather(
-        asyncio.create_task(mouse_task()),
-        asyncio.create_task(keyboard_task()),
-        asyncio.create_task(gamepad_task()),
-        asyncio.create_task(buttons_task()),
+        *(asyncio.create_task(task) for task in tasks),
         asyncio.create_task(gameplay_task()),
-        asyncio.create_task(computer_task()),
     )
 
 try:
     asyncio.run(main())
 except KeyboardInterrupt:
+    if recorder is not None:
+        recorder.flush()
     peripherals.deinit()
@@ -0,0 +1,5 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+# host-side tooling to run the game and guide stages under CPython without a Fruit Jam
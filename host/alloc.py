@@ -0,0 +1,247 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+# usage: python -m host.alloc [code.py | guide/N_*.py] [--frames 600] [--top 25] [--seed 0] [--json results.json]
+#
+# Ranks the source lines of a program and the `pong` package by how much they allocate per
+# gameplay frame, to find the allocations which add up to garbage collection pauses on the device.
+# The game runs on the turbo clock against the scripted input of `host.bench` with `tracemalloc`
+# on and a line tracer on every frame of the program, its tasks and `pong`. At each line the peak
+# of traced memory since the previous line is charged to the previous line, so temporaries which
+# are freed straight away (ie: a tuple returned by `get_random_velocity`, a float, the generator
+# of an `any(...)` or the string given to `Label.text`) are counted even though CPython frees
+# them at once. Calls into the standard library are charged to the line which made them, while
+# the host shims and asyncio are left out since they work differently on the device. What tracing
+# takes up at each line, call, resume and return, including the frame object it creates for every
+# call, is calibrated against code which allocates nothing and taken off of every charge.
+#
+# CPython and CircuitPython don't allocate alike: CPython reuses some small tuples and floats from
+# free lists, so those lines can be under-counted. It allocates every int above 256 where
+# CircuitPython only allocates ints beyond 30 bits, and creates a coroutine object for every
+# `await asyncio.sleep(...)`, so tick arithmetic and sleeps are over-counted. On the
+# device, set `PONG_PROFILE = 1` in settings.toml and press `a` for the real totals of each part
+# of the gameplay frame.
+
+import argparse
+import asyncio
+import json
+import linecache
+from pathlib import Path
+import sys
+import tracemalloc
+
+from host import bench, runtime
+
+ROOT = Path(__file__).parent.parent
+PACKAGE_DIRECTORY = str(ROOT / "pong")
+CALIBRATION_LINES = 64
+
+# what a charge is made at, and what returned to the frame since the previous charge
+LINE, RETURN, CALL, EXCLUDED_CALL, RESUME, EXCLUDED_RESUME = range(6)
+NOTHING, TRACED, EXCLUDED = range(3)
+
+class LineTracer:
+    def __init__(self, files: set, directories: tuple, excluded: tuple):
+        self.files = files  # code to charge allocations to, by filename
+        self.directories = directories
+        self.excluded = excluded  # code whose allocations aren't charged to anything
+        self.lines = {}  # (filename, line) -> [hits, allocations, bytes]
+        self.overheads = [0] * 18  # bytes the tracer itself shows up as, by event * 3 + what returned before it
+        self._samples = None  # bytes seen for each kind of charge while calibrating
+        self._stack = []  # line being run in each traced frame, None for excluded frames
+        self._returned = NOTHING
+        self._base = 0
+        self._trace = self._local  # bound once rather than on every event
+
+    def _traced(self, filename: str) -> bool:
+        return filename in self.files or filename.startswith(self.directories)
+
+    def _charge(self, event: int, frame_size: int = 0) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        allocated = peak - self._base - frame_size
+        key = event * 3 + self._returned
+        self._returned = NOTHING
+        if self._samples is not None:
+            self._samples[key].append(allocated)
+        elif self._stack and (line := self._stack[-1]) is not None:
+            if (stats := self.lines.get(line)) is None:
+                stats = self.lines[line] = [0, 0, 0]
+            if event <= RETURN:  # the line is done, rather than calling out
+                stats[0] += 1
+            if (allocated := allocated - self.overheads[key]) > 0:
+                stats[1] += 1
+                stats[2] += allocated
+
+    def _rebase(self) -> None:
+        # starts measuring the next line from here, once the tracer's own bookkeeping is done so
+        # that what it still holds doesn't hide allocations of that size
+        self._base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+    def _call(self, frame, event: str, arg):
+        # Called on every new frame and every resumed generator or coroutine. Tracing creates a
+        # frame object for each new frame, which grows with the function's locals and stack and is
+        # left out along with the rest of the call's overhead.
+        filename = frame.f_code.co_filename
+        resumed = frame.f_lineno != frame.f_code.co_firstlineno
+        if self._traced(filename):
+            self._charge(RESUME, 0) if resumed else self._charge(CALL, sys.getsizeof(frame))
+            self._stack.append((filename, frame.f_lineno))
+            self._rebase()
+            return self._trace
+        if filename.startswith(self.excluded):
+            self._charge(EXCLUDED_RESUME, 0) if resumed else self._charge(EXCLUDED_CALL, sys.getsizeof(frame))
+            self._stack.append(None)
+            frame.f_trace_lines = False
+            self._rebase()
+            return self._trace
+        return None
+
+    def _local(self, frame, event: str, arg):
+        if event == "line":
+            self._charge(LINE)
+            self._stack[-1] = (frame.f_code.co_filename, frame.f_lineno)
+        elif event == "return":  # also when a generator or coroutine is suspended
+            self._charge(RETURN)
+            self._returned = EXCLUDED if self._stack.pop() is None else TRACED
+        self._rebase()
+        return self._trace
+
+    def start(self) -> None:
+        sys.settrace(self._call)
+
+    def stop(self) -> None:
+        sys.settrace(None)
+
+    def calibrate(self) -> None:
+        # Code which allocates nothing is run to find what the tracer itself shows up as for every
+        # kind of charge, including what calling into, resuming and returning from traced and
+        # excluded functions costs. Otherwise a line which only makes a call is charged for it.
+        caller, traced, excluded = _calibration_functions(self.excluded[0])
+        filenames = (caller.__code__.co_filename, traced["callee"].__code__.co_filename)
+        self.files.update(filenames)
+        self._samples = [[] for i in range(len(self.overheads))]
+        self.start()
+        caller(CALIBRATION_LINES, traced["callee"], excluded["callee"], traced["generator"](), excluded["generator"]())
+        self.stop()
+        self.files.difference_update(filenames)
+
+        medians = [sorted(samples)[len(samples) // 2] if samples else None for samples in self._samples]
+        for key, median in enumerate(medians):
+            if median is None:  # ie: a return right after a call, made up from a line after that call
+                event, returned = divmod(key, 3)
+                median = medians[event * 3] + medians[LINE * 3 + returned] - medians[LINE * 3]
+            self.overheads[key] = median
+        self._samples = None
+        self._stack.clear()
+        self._returned = NOTHING
+
+_CALIBRATION = """
+def caller(count, traced, excluded, traced_generator, excluded_generator):
+    i = 0
+    while i < count:
+        traced()
+        traced()
+        excluded()
+        excluded()
+        traced(excluded())
+        excluded(traced())
+        traced(traced())
+        excluded(excluded())
+        next(traced_generator)
+        next(excluded_generator)
+        traced(next(traced_generator))
+        excluded(next(excluded_generator))
+        i += 1
+
+def callee(value=None):
+    pass
+
+def generator():
+    while True:
+        yield
+"""
+
+def _calibration_functions(excluded_directory: str) -> tuple:
+    # the caller and one set of callees are traced while the other set is in an excluded
+    # directory, so that each kind of call and return gets samples
+    namespaces = []
+    for filename in ("<calibration>", "<calibration callee>", str(Path(excluded_directory) / "<calibration>")):
+        namespace = {}
+        exec(compile(_CALIBRATION, filename, "exec"), namespace)
+        namespaces.append(namespace)
+    return namespaces[0]["caller"], namespaces[1], namespaces[2]
+
+def run(program: str, frames: int, seed: int) -> tuple:
+    program = str(Path(program).resolve())
+    samples = []
+    tracer = LineTracer(
+        {program}, (PACKAGE_DIRECTORY,),
+        (str(runtime.SHIMS_DIRECTORY), str(Path(runtime.__file__).parent), str(Path(asyncio.__file__).parent)),
+    )
+    session = runtime.Session(seed=seed, script=bench.input_script(frames / 30 * 4), audio=False, neopixels=False)
+
+    def start(namespace: dict) -> None:
+        if "gameplay_task" in namespace:
+            namespace["gameplay_task"] = bench._wrap_task(namespace["gameplay_task"], samples)
+
+        # stop once the gameplay task has run enough frames
+        def check() -> None:
+            if len(samples) >= frames:
+                tracer.stop()
+                session.stop()
+            else:
+                session.loop.call_later(1 / 30, check)
+        session.loop.call_soon(check)
+        tracer.start()  # everything above is part of starting up
+
+    tracemalloc.start()
+    tracer.calibrate()
+    session.on_start(start)
+    try:
+        session.run(program)
+    finally:
+        tracer.stop()
+        tracemalloc.stop()
+    return tracer.lines, len(samples)
+
+def report(lines: dict, frames: int, top: int) -> list:
+    ranked = sorted(lines.items(), key=lambda item: -item[1][2])[:top]
+    frames = max(frames, 1)
+    results = []
+    print("{:d} gameplay frames, allocations per frame by line".format(frames))
+    print("{:>10s} {:>8s} {:>8s}  {}".format("bytes", "allocs", "runs", "line"))
+    for (filename, line), (hits, allocations, allocated) in ranked:
+        if not allocated:
+            break
+        path = Path(filename)
+        location = "{}:{:d}".format(path.relative_to(ROOT) if path.is_relative_to(ROOT) else path.name, line)
+        source = linecache.getline(filename, line).strip()
+        print("{:10.1f} {:8.2f} {:8.2f}  {:32s} {}".format(
+            allocated / frames, allocations / frames, hits / frames, location, source[:60],
+        ))
+        results.append({
+            "location": location, "source": source,
+            "bytes_per_frame": allocated / frames, "allocations_per_frame": allocations / frames, "runs_per_frame": hits / frames,
+        })
+    return results
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rank source lines by their allocations per gameplay frame")
+    parser.add_argument("program", nargs="?", default="code.py")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--top", type=int, default=25, help="number of lines to report")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="write the ranked lines to a json file for comparing between commits")
+    args = parser.parse_args()
+
+    lines, frames = run(args.program, args.frames, args.seed)
+    results = report(lines, frames, args.top)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"frames": frames, "lines": results}, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+# usage: python -m host.bench [code.py] [--frames 5000] [--seed 0] [--json results.json]
+#
+# Runs the game on the turbo clock against a scripted mix of keyboard, gamepad, mouse and button
+# input until the gameplay task has run a fixed number of frames. Every resume of each task is
+# timed, so a gameplay "frame" is the work done between two of its awaits. The hot functions are
+# wrapped to total their time. Allocations are measured in a second, traced pass so that tracing
+# doesn't skew the timing. CPython frees most temporaries immediately, so the figure reported is
+# the peak of traced memory above the start of each frame.
+
+import argparse
+import json
+import time
+import tracemalloc
+import types
+
+from host import runtime
+
+TASKS = ("gameplay_task", "computer_task", "input_task", "neopixel_task")
+FUNCTIONS = ("paddle_move", "apply_intents", "handle_input")
+METHODS = (("ball_physics", "step"), ("neopixel_renderer", "render"))
+PERCENTILES = (50, 95, 99)
+
+def percentile(samples: list, p: int) -> float:
+    if not samples:
+        return 0.
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * p / 100))]
+
+def input_script(seconds: float) -> list:
+    # exercise every input source continuously while pressing start every few seconds
+    script = [{"t": .1, "serial": "\n"}, {"t": .1, "mouse": {"connected": True}}]
+    t = .2
+    i = 0
+    while t < seconds:
+        direction = 1 if (i // 15) % 2 else -1
+        script.append({"t": t, "serial": "\x1b[A" if direction > 0 else "\x1b[B"})
+        script.append({"t": t, "button": 3, "pressed": direction > 0})
+        script.append({"t": t, "button": 1, "pressed": direction < 0})
+        script.append({"t": t, "gamepad": 1, "buttons": ["UP" if direction > 0 else "DOWN"]})
+        script.append({"t": t, "mouse": {"dy": -3 * direction}})
+        if not i % 150:
+            script.append({"t": t, "serial": "\n"})
+        t += 1 / 30
+        i += 1
+    return script
+
+@types.coroutine
+def _timed(coro, samples: list, allocations: list = None):
+    # drives a coroutine just like the event loop would, measuring each resume
+    value, error = None, None
+    while True:
+        if allocations is not None:
+            tracemalloc.reset_peak()
+            start_memory = tracemalloc.get_traced_memory()[0]
+        started = time.perf_counter()
+        try:
+            yielded = coro.throw(error) if error is not None else coro.send(value)
+        except StopIteration as stop:
+            return stop.value
+        finally:
+            samples.append(time.perf_counter() - started)
+            if allocations is not None:
+                allocations.append(tracemalloc.get_traced_memory()[1] - start_memory)
+        try:
+            value, error = (yield yielded), None
+        except BaseException as e:
+            value, error = None, e
+
+def _wrap_task(task, samples: list, allocations: list = None):
+    async def wrapper():
+        return await _timed(task(), samples, allocations)
+    return wrapper
+
+def _wrap_function(function, totals: dict, name: str):
+    totals[name] = [0, 0.]
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            total = totals[name]
+            total[0] += 1
+            total[1] += time.perf_counter() - started
+    return wrapper
+
+def run(program: str, frames: int, seed: int, traced: bool = False) -> dict:
+    samples = {name: [] for name in TASKS}
+    allocations = [] if traced else None
+    totals = {}
+
+    session = runtime.Session(seed=seed, script=input_script(frames / 30 * 4))
+
+    def start(namespace: dict) -> None:
+        for name in TASKS:
+            if name in namespace:
+                namespace[name] = _wrap_task(namespace[name], samples[name], allocations if name == "gameplay_task" else None)
+        for name in FUNCTIONS:
+            if name in namespace:
+                namespace[name] = _wrap_function(namespace[name], totals, name)
+        for name, method in METHODS:
+            if namespace.get(name) is not None:
+                setattr(namespace[name], method, _wrap_function(getattr(namespace[name], method), totals, name + "." + method))
+
+        # stop once the gameplay task has run enough frames
+        gameplay = samples["gameplay_task"]
+        def check() -> None:
+            if len(gameplay) >= frames:
+                session.stop()
+            else:
+                session.loop.call_later(1 / 30, check)
+        session.loop.call_soon(check)
+
+    session.on_start(start)
+    if traced:
+        tracemalloc.start()
+    try:
+        session.run(program)
+    finally:
+        if traced:
+            tracemalloc.stop()
+
+    frame_count = max(len(samples["gameplay_task"]), 1)
+    results = {
+        "frames": len(samples["gameplay_task"]),
+        "tasks": {
+            name: {
+                "ticks": len(task_samples),
+                **{"p{:d}_us".format(p): percentile(task_samples, p) * 1e6 for p in PERCENTILES},
+            }
+            for name, task_samples in samples.items() if task_samples
+        },
+        "functions": {
+            name: {"calls": calls, "total_ms": total * 1e3, "per_frame_us": total / frame_count * 1e6}
+            for name, (calls, total) in totals.items()
+        },
+    }
+    if traced:
+        results["allocations"] = {
+            "mean_bytes": sum(allocations) / max(len(allocations), 1),
+            **{"p{:d}_bytes".format(p): percentile(allocations, p) for p in PERCENTILES},
+        }
+    return results
+
+def report(results: dict) -> None:
+    print("{:d} gameplay frames".format(results["frames"]))
+    print()
+    print("{:16s} {:>8s} {:>10s} {:>10s} {:>10s}".format("task", "ticks", "p50 us", "p95 us", "p99 us"))
+    for name, task in results["tasks"].items():
+        print("{:16s} {:8d} {:10.1f} {:10.1f} {:10.1f}".format(name, task["ticks"], task["p50_us"], task["p95_us"], task["p99_us"]))
+    print()
+    print("{:24s} {:>8s} {:>10s} {:>12s}".format("function", "calls", "total ms", "us / frame"))
+    for name, function in results["functions"].items():
+        print("{:24s} {:8d} {:10.2f} {:12.2f}".format(name, function["calls"], function["total_ms"], function["per_frame_us"]))
+    if "allocations" in results:
+        allocations = results["allocations"]
+        print()
+        print("allocation peak per frame: mean {:.0f} B, p50 {:.0f} B, p95 {:.0f} B, p99 {:.0f} B".format(
+            allocations["mean_bytes"], allocations["p50_bytes"], allocations["p95_bytes"], allocations["p99_bytes"],
+        ))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark frame times of the game tasks")
+    parser.add_argument("program", nargs="?", default="code.py")
+    parser.add_argument("--frames", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="write results to a json file for comparing between commits")
+    args = parser.parse_args()
+
+    results = run(args.program, args.frames, args.seed)
+    results["allocations"] = run(args.program, args.frames, args.seed, traced=True)["allocations"]
+    report(results)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
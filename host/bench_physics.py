@@ -0,0 +1,156 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+# usage: python -m host.bench_physics [--steps 100000]
+#
+# Compares physics steps per second, heap allocations and garbage collections of the float ball
+# physics which the game used previously against the fixed-point `pong.physics.BallPhysics`.
+# Paddles track the ball so that rallies continue and the speed ramp up to the cap gets exercised.
+#
+# Allocations are counted from drops in `gc.mem_free()` after every step, in a separate pass from
+# the timing, which only CircuitPython has. CPython allocates floats and ints differently anyway,
+# so on the host only the speed is compared. To compare both on the device, copy this file to the
+# CIRCUITPY drive as `code.py` next to the `pong` folder and watch the serial console.
+
+try:
+    import argparse
+except ImportError:  # CircuitPython, run with the defaults
+    argparse = None
+import gc
+import random
+import time
+
+from pong import physics
+
+WIDTH, HEIGHT = 320, 240
+PADDLE_SPEED = 6
+INITIAL_BALL_SPEED = 1
+BALL_SPEED_MODIFIER = 1.25
+RALLY_STEPS = 600  # reset the ball periodically to repeat the speed ramp
+STEPS = 100000
+DEVICE_STEPS = 6000
+
+class Rect:
+    def __init__(self, x: int, y: int, width: int, height: int):
+        self.x, self.y, self.width, self.height = x, y, width, height
+
+def _playfield() -> tuple:
+    ball = Rect((WIDTH - 8) // 2, (HEIGHT - 8) // 2, 8, 8)
+    paddles = [Rect(16, HEIGHT // 2 - 8, 4, 32), Rect(WIDTH - 20, HEIGHT // 2 - 8, 4, 32)]
+    return ball, paddles
+
+def _track(ball: Rect, paddles: list) -> None:
+    for paddle in paddles:
+        paddle.y = min(max(ball.y - 12, 0), HEIGHT - paddle.height)
+
+def sweep(x: float, y: float, dx: float, dy: float, width: int, height: int, rect) -> float:
+    # Find the time of impact (0 to 1) of a box at (x, y) of the given size moving by (dx, dy)
+    # against a rectangle, or -1 if they don't meet during this movement. The rectangle is grown
+    # by the size of the box so that we only have to trace the path of the box's top-left corner.
+    # Touching edges count as a hit to match the inclusive bounds of the original `collides` check.
+    left, right = rect.x - width, rect.x + rect.width
+    top, bottom = rect.y - height, rect.y + rect.height
+
+    # x axis entry and exit times
+    if dx > 0:
+        enter, leave = (left - x) / dx, (right - x) / dx
+    elif dx < 0:
+        enter, leave = (right - x) / dx, (left - x) / dx
+    elif left <= x <= right:
+        enter, leave = 0, 1
+    else:
+        return -1
+
+    # y axis entry and exit times narrowed down by the x axis
+    if dy > 0:
+        enter, leave = max(enter, (top - y) / dy), min(leave, (bottom - y) / dy)
+    elif dy < 0:
+        enter, leave = max(enter, (bottom - y) / dy), min(leave, (top - y) / dy)
+    elif not top <= y <= bottom:
+        return -1
+
+    if enter > leave or enter > 1 or leave < 0:
+        return -1
+    return max(enter, 0)
+
+def float_steps(steps: int, monitor=None) -> None:
+    ball, paddles = _playfield()
+    for i in range(steps):
+        if not i % RALLY_STEPS:
+            ball.x, ball.y = (WIDTH - ball.width) // 2, (HEIGHT - ball.height) // 2
+            ball_x, ball_y = ball.x, ball.y
+            velocity_x, velocity_y = random.choice((-1, 1)), random.choice((-1, 1))
+            ball_speed = INITIAL_BALL_SPEED
+
+        dx, dy = velocity_x * ball_speed, velocity_y * ball_speed
+        if (impact := sweep(ball_x, ball_y, dx, dy, ball.width, ball.height, paddles[int(velocity_x > 0)])) >= 0:
+            ball_x += dx * impact
+            ball_y += dy * impact
+            velocity_x *= -1
+            ball_speed = min(ball_speed * BALL_SPEED_MODIFIER, PADDLE_SPEED)
+            dx, dy = velocity_x * ball_speed * (1 - impact), velocity_y * ball_speed * (1 - impact)
+        ball_x += dx
+        ball_y += dy
+        ball.x, ball.y = int(ball_x), int(ball_y)
+        if (velocity_y < 0 and ball.y <= 0) or (velocity_y > 0 and ball.y + ball.height >= HEIGHT):
+            velocity_y *= -1
+        _track(ball, paddles)
+        if monitor is not None:
+            monitor()
+
+def fixed_steps(steps: int, monitor=None) -> None:
+    ball, paddles = _playfield()
+    ball_physics = physics.BallPhysics(ball, HEIGHT, INITIAL_BALL_SPEED, BALL_SPEED_MODIFIER, PADDLE_SPEED)
+    for i in range(steps):
+        if not i % RALLY_STEPS:
+            ball_physics.reset((WIDTH - ball.width) // 2, (HEIGHT - ball.height) // 2, (random.choice((-1, 1)), random.choice((-1, 1))))
+        ball_physics.step(paddles)
+        _track(ball, paddles)
+        if monitor is not None:
+            monitor()
+
+class AllocationCounter:
+    # counts how much free memory drops by between calls, a rise means the garbage collector ran
+    def __init__(self):
+        self.allocated = 0
+        self.collections = 0
+        self._free = gc.mem_free()
+
+    def __call__(self) -> None:
+        free = gc.mem_free()
+        if free > self._free:
+            self.collections += 1
+        else:
+            self.allocated += self._free - free
+        self._free = gc.mem_free()  # leave out the int returned by the first call
+
+def measure(name: str, function, steps: int) -> None:
+    random.seed(0)
+    gc.collect()
+    started = time.monotonic_ns()
+    function(steps)
+    elapsed = time.monotonic_ns() - started
+    if not hasattr(gc, "mem_free"):
+        print("{:6s} {:10.0f} steps/s".format(name, steps * 1e9 / elapsed))
+        return
+
+    random.seed(0)
+    gc.collect()
+    counter = AllocationCounter()
+    function(steps, counter)
+    print("{:6s} {:10.0f} steps/s {:8.1f} B/step {:6d} gc collections".format(
+        name, steps * 1e9 / elapsed, counter.allocated / steps, counter.collections,
+    ))
+
+def main() -> None:
+    steps = DEVICE_STEPS
+    if argparse is not None:
+        parser = argparse.ArgumentParser(description="Benchmark float against fixed-point ball physics")
+        parser.add_argument("--steps", type=int, default=STEPS)
+        steps = parser.parse_args().steps
+    measure("float", float_steps, steps)
+    measure("fixed", fixed_steps, steps)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+# usage: python -m host.bench_render [code.py] [--frames 3000] [--modes 320 640 720] [--json results.json]
+#
+# Runs the game with each playfield backend (`PONG_RENDERER`) in each display mode
+# (`PONG_DISPLAY_WIDTH`) against the scripted input of `host.bench`, and compares the frames drawn
+# during rallies. The host can't tell how long the Fruit Jam takes to push pixels out, so the time
+# reported is what the playfield itself spends getting each frame ready, along with the area which
+# displayio has to redraw for it. displayio redraws the union of the old and new area of every
+# vectorio shape which changed, but only a single area per bitmap covering every change made to it.
+# To compare the actual refresh times, run the game on the device with each backend and press `f`.
+
+import argparse
+import json
+import os
+import time
+
+from host import bench, runtime
+
+RENDERERS = ("vectorio", "bitmap")
+FRAME_BUDGET_MS = 1000 / 60
+
+def _area(x1: int, y1: int, x2: int, y2: int, width: int, height: int) -> int:
+    return max(min(x2, width) - max(x1, 0), 0) * max(min(y2, height) - max(y1, 0), 0)
+
+class _VectorioAreas:
+    # the bounds of each shape as of the last refresh
+    def __init__(self, rectangles: list):
+        self.rectangles = rectangles
+        self.bounds = [None] * len(rectangles)
+
+    def __call__(self, width: int, height: int) -> int:
+        area = 0
+        for i, rectangle in enumerate(self.rectangles):
+            bounds = None if rectangle.hidden else (
+                rectangle.x, rectangle.y, rectangle.x + rectangle.width, rectangle.y + rectangle.height,
+            )
+            if bounds != self.bounds[i]:
+                if self.bounds[i] is not None:
+                    area += _area(*self.bounds[i], width, height)
+                if bounds is not None:
+                    area += _area(*bounds, width, height)
+                self.bounds[i] = bounds
+        return area
+
+class _BitmapAreas:
+    def __init__(self, bitmap):
+        self.bitmap = bitmap
+
+    def __call__(self, width: int, height: int) -> int:
+        if self.bitmap._dirty_area is None:
+            return 0
+        area = _area(*self.bitmap._dirty_area, width, height)
+        self.bitmap._dirty_area = None
+        return area
+
+def run(program: str, renderer: str, width: int, frames: int, seed: int) -> dict:
+    os.environ["PONG_RENDERER"] = renderer
+    os.environ["PONG_DISPLAY_WIDTH"] = str(width)
+    draw_times, areas = [], []
+    state = {}
+
+    session = runtime.Session(seed=seed, script=bench.input_script(frames / 30 * 4), audio=False, neopixels=False)
+
+    def start(namespace: dict) -> None:
+        playfield = namespace["playfield"]
+        state["renderer"] = namespace["renderer"]
+        state["areas"] = _BitmapAreas(playfield.bitmap) if hasattr(playfield, "bitmap") else _VectorioAreas(playfield.rectangles)
+
+        draw = playfield.draw
+        def timed_draw() -> None:
+            started = time.perf_counter()
+            draw()
+            state["draw_time"] = time.perf_counter() - started
+        playfield.draw = timed_draw
+
+    def refreshed(display) -> None:
+        if "areas" not in state:
+            return
+        area = state["areas"](display.width, display.height)
+        if state["renderer"].owned:  # only count frames drawn during a rally
+            draw_times.append(state.get("draw_time", 0.))
+            areas.append(area)
+            if len(draw_times) >= frames:
+                session.stop()
+
+    session.on_start(start)
+    session.on_refresh(refreshed)
+    try:
+        session.run(program)
+    finally:
+        del os.environ["PONG_RENDERER"]
+        del os.environ["PONG_DISPLAY_WIDTH"]
+
+    return {
+        "renderer": renderer,
+        "mode": "{:d}x{:d}".format(session.display.width, session.display.height),
+        "frames": len(draw_times),
+        **{"draw_p{:d}_us".format(p): bench.percentile(draw_times, p) * 1e6 for p in bench.PERCENTILES},
+        "mean_pixels": sum(areas) / max(len(areas), 1),
+        "max_pixels": max(areas, default=0),
+    }
+
+def report(results: list) -> None:
+    print("{:10s} {:10s} {:>7s} {:>10s} {:>10s} {:>10s} {:>12s} {:>10s}".format(
+        "mode", "renderer", "frames", "p50 us", "p95 us", "p99 us", "mean pixels", "max pixels",
+    ))
+    for result in results:
+        print("{:10s} {:10s} {:7d} {:10.1f} {:10.1f} {:10.1f} {:12.0f} {:10d}".format(
+            result["mode"], result["renderer"], result["frames"],
+            result["draw_p50_us"], result["draw_p95_us"], result["draw_p99_us"],
+            result["mean_pixels"], result["max_pixels"],
+        ))
+    print()
+    print("pixels are the area displayio redraws per frame, every frame has {:.1f}ms at 60 FPS".format(FRAME_BUDGET_MS))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare the vectorio and bitmap playfield backends")
+    parser.add_argument("program", nargs="?", default="code.py")
+    parser.add_argument("--frames", type=int, default=3000, help="rally frames to draw with each backend and mode")
+    parser.add_argument("--modes", type=int, nargs="+", default=[320, 640, 720], help="display widths to test")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="write results to a json file for comparing between commits")
+    args = parser.parse_args()
+
+    results = [
+        run(args.program, renderer, width, args.frames, args.seed)
+        for width in args.modes for renderer in RENDERERS
+    ]
+    report(results)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
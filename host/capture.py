@@ -0,0 +1,75 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+# usage: python -m host.capture guide/N_*.py output.gif [--script inputs.jsonl] [--start] [--seconds 10]
+#                               [--skip 0] [--fps 25] [--scale 2] [--seed 0]
+#
+# Records a program running on the turbo clock into an animated GIF for the docs. The display is
+# rasterized each time it is refreshed, and whatever was last refreshed is sampled `--fps` times
+# per simulated second and streamed straight into `host.gif.GifWriter`, so only a couple of frames
+# are ever held in memory however long the clip is. Inputs come from the same json lines scripts
+# as `host.run`. Requires numpy.
+
+import argparse
+
+from host import runtime
+from host.gif import GifWriter
+from host.raster import Rasterizer
+
+MAX_FPS = 50  # browsers slow down any GIF frame shorter than 2 centiseconds
+
+def capture(program: str, path: str, script: list, seconds: float, skip: float = 0., fps: int = 25,
+            scale: int = 1, seed: int = 0) -> GifWriter:
+    session = runtime.Session(seconds=skip + seconds, seed=seed, script=script, audio=False, neopixels=False)
+    state = {"frame": None, "writer": None, "rasterizer": None}
+
+    def refreshed(display) -> None:
+        if state["rasterizer"] is None:
+            state["rasterizer"] = Rasterizer(display.width, display.height)
+        state["frame"] = state["rasterizer"].render(display.root_group).copy()
+
+    def sample() -> None:
+        if state["frame"] is not None:
+            if state["writer"] is None:
+                height, width = state["frame"].shape[:2]
+                state["writer"] = GifWriter(f, width, height, scale)
+            state["writer"].write(state["frame"], 1 / fps)
+        session.loop.call_later(1 / fps, sample)
+
+    session.on_start(lambda namespace: session.loop.call_at(skip, sample))
+    session.on_refresh(refreshed)
+    with open(path, "wb") as f:
+        session.run(program)
+        if state["writer"] is not None:
+            state["writer"].close()
+    return state["writer"]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Record a Fruit Jam Pong program into an animated GIF")
+    parser.add_argument("program")
+    parser.add_argument("output")
+    parser.add_argument("--script", help="json lines file of timed input events")
+    parser.add_argument("--start", action="store_true", help="press enter shortly after starting")
+    parser.add_argument("--seconds", type=float, default=10, help="simulated seconds to record")
+    parser.add_argument("--skip", type=float, default=0, help="simulated seconds to run before recording")
+    parser.add_argument("--fps", type=int, default=25)
+    parser.add_argument("--scale", type=int, default=1, help="pixel size of the output")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    script = runtime.load_script(args.script) if args.script else []
+    if args.start:
+        script.append({"t": .1, "serial": "\n"})
+
+    writer = capture(
+        args.program, args.output, script, args.seconds,
+        skip=args.skip, fps=min(args.fps, MAX_FPS), scale=args.scale, seed=args.seed,
+    )
+    if writer is None:
+        print("Nothing was displayed")
+    else:
+        print("{:d} frames with {:d} colors written to {}".format(writer.frames, len(writer.colors), args.output))
+
+if __name__ == "__main__":
+    main()
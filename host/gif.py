@@ -0,0 +1,149 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+# Streams RGB NumPy frames from `host.raster` into an animated GIF one at a time. Only the
+# previous frame is kept: each new frame is compared against it and just the rectangle of pixels
+# which changed is written, with the unchanged pixels inside it left transparent so that they
+# compress into long runs. Frames which don't change anything only extend the delay of the frame
+# before them. Colors are added to a global color table as they first appear, which is written
+# out in place once the clip is finished, so up to 255 distinct colors can be used.
+
+import struct
+
+import numpy
+
+TRANSPARENT = 255  # color table index of pixels which keep the previous frame
+MAX_CODE_SIZE = 12
+
+def lzw(indices: bytes, minimum_size: int) -> bytes:
+    # compresses color indices into GIF flavored LZW codes, packed least significant bit first
+    clear, end = 1 << minimum_size, (1 << minimum_size) + 1
+    output = bytearray()
+    buffer, bits = 0, 0
+    size = minimum_size + 1
+
+    def emit(code: int) -> None:
+        nonlocal buffer, bits
+        buffer |= code << bits
+        bits += size
+        while bits >= 8:
+            output.append(buffer & 0xff)
+            buffer >>= 8
+            bits -= 8
+
+    emit(clear)
+    codes = {}
+    next_code = end + 1
+    prefix = -1
+    for index in indices:
+        if prefix < 0:
+            prefix = index
+            continue
+        key = (prefix << 8) | index
+        if (code := codes.get(key)) is not None:
+            prefix = code
+            continue
+        emit(prefix)
+        if next_code < 1 << MAX_CODE_SIZE:
+            codes[key] = next_code
+            if next_code == 1 << size and size < MAX_CODE_SIZE:
+                size += 1
+            next_code += 1
+        else:  # the table is full, start over
+            emit(clear)
+            codes.clear()
+            next_code = end + 1
+            size = minimum_size + 1
+        prefix = index
+    if prefix >= 0:
+        emit(prefix)
+    emit(end)
+    if bits:
+        output.append(buffer & 0xff)
+    return bytes(output)
+
+class GifWriter:
+    def __init__(self, file, width: int, height: int, scale: int = 1):
+        self.file = file  # opened for binary writing, and must be seekable
+        self.width = width * scale
+        self.height = height * scale
+        self.scale = scale
+        self.frames = 0
+        self.colors = {}  # 0xrrggbb -> color table index
+        self._previous = None  # 0xrrggbb colors of the last frame
+        self._pending = None  # (descriptor and image data, centiseconds) of the frame waiting on its delay
+        self._remainder = 0.  # fraction of a centisecond carried over between delays
+
+        file.write(b"GIF89a")
+        file.write(struct.pack("<HHBBB", self.width, self.height, 0xf7, 0, 0))  # 256 color global table
+        self._table_offset = file.tell()
+        file.write(bytes(256 * 3))
+        file.write(b"\x21\xff\x0bNETSCAPE2.0\x03\x01\x00\x00\x00")  # loop forever
+
+    def _index(self, packed: numpy.ndarray) -> numpy.ndarray:
+        # maps 0xrrggbb colors to color table indices
+        colors, inverse = numpy.unique(packed, return_inverse=True)
+        lookup = numpy.empty(len(colors), dtype=numpy.uint8)
+        for i, color in enumerate(colors.tolist()):
+            if (index := self.colors.get(color)) is None:
+                if len(self.colors) >= TRANSPARENT:
+                    raise ValueError("Too many colors")
+                index = self.colors[color] = len(self.colors)
+            lookup[i] = index
+        return lookup[inverse.reshape(packed.shape)]
+
+    def write(self, frame: numpy.ndarray, seconds: float) -> None:
+        # adds an (height, width, 3) frame which is shown for `seconds`
+        packed = (frame[..., 0].astype(numpy.uint32) << 16) | (frame[..., 1].astype(numpy.uint32) << 8) | frame[..., 2]
+
+        # only the changed rectangle is mapped to the color table and scaled up
+        if self._previous is None:
+            x1, y1, x2, y2 = 0, 0, packed.shape[1], packed.shape[0]
+            image = self._index(packed)
+        else:
+            changed = packed != self._previous
+            rows, columns = numpy.flatnonzero(changed.any(axis=1)), numpy.flatnonzero(changed.any(axis=0))
+            if not len(rows):
+                self._extend(seconds)
+                return
+            x1, y1, x2, y2 = int(columns[0]), int(rows[0]), int(columns[-1]) + 1, int(rows[-1]) + 1
+            image = numpy.where(changed[y1:y2, x1:x2], self._index(packed[y1:y2, x1:x2]), TRANSPARENT).astype(numpy.uint8)
+        self._previous = packed
+        if self.scale > 1:
+            image = image.repeat(self.scale, axis=0).repeat(self.scale, axis=1)
+            x1, y1, x2, y2 = x1 * self.scale, y1 * self.scale, x2 * self.scale, y2 * self.scale
+
+        self._flush()
+        minimum_size = max(2, int(image.max()).bit_length())
+        data = lzw(image.tobytes(), minimum_size)
+        chunks = b"".join(bytes((len(data[i:i + 255]),)) + data[i:i + 255] for i in range(0, len(data), 255))
+        self._pending = [
+            struct.pack("<BHHHHB", 0x2c, x1, y1, x2 - x1, y2 - y1, 0) + bytes((minimum_size,)) + chunks + b"\x00",
+            0,
+        ]
+        self._extend(seconds)
+        self.frames += 1
+
+    def _extend(self, seconds: float) -> None:
+        delay = seconds * 100 + self._remainder
+        self._remainder = delay - int(delay)
+        self._pending[1] += int(delay)
+
+    def _flush(self) -> None:
+        if self._pending is None:
+            return
+        image, delay = self._pending
+        # graphic control extension: leave the frame in place and skip transparent pixels
+        self.file.write(struct.pack("<BBBBHBB", 0x21, 0xf9, 4, 0x05, min(delay, 0xffff), TRANSPARENT, 0))
+        self.file.write(image)
+        self._pending = None
+
+    def close(self) -> None:
+        self._flush()
+        self.file.write(b"\x3b")
+        end = self.file.tell()
+        for color, index in self.colors.items():
+            self.file.seek(self._table_offset + index * 3)
+            self.file.write(bytes(((color >> 16) & 0xff, (color >> 8) & 0xff, color & 0xff)))
+        self.file.seek(end)
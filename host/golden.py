@@ -0,0 +1,119 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+# usage: python -m host.golden [code.py guide/N_*.py ...] [--update] [--golden host/golden.json]
+#
+# Visual regression check. Runs each program on the turbo clock with a fixed seed, pressing enter
+# once and leaving the paddles alone, and rasterizes the display with `host.raster` on every
+# refresh. The frames of a few states are hashed along with one hash of every frame in the run:
+#
+#   serve  the first frame shown before the game is started
+#   rally  the first frame one second after the game is started
+#   win    the first frame with a "WIN" label showing
+#
+# States which a program never reaches (ie: there is no win screen before `5_scoring.py`) are
+# left out. Without `--update`, the hashes are compared against the golden file and the command
+# exits with an error if any of them differ. Requires numpy.
+
+import argparse
+import hashlib
+import json
+from pathlib import Path
+import sys
+import time
+
+from host import runtime
+from host.raster import Rasterizer
+
+ROOT = Path(__file__).parent.parent
+GOLDEN_PATH = Path(__file__).parent / "golden.json"
+SEED = 1
+START_TIME = .5  # when enter is pressed
+RALLY_DELAY = 1.
+SECONDS = 180  # give up on reaching the win screen after this long, every stage which has one gets there in about two minutes
+
+def _win_showing(group) -> bool:
+    for layer in group:
+        if not layer.hidden and (getattr(layer, "text", None) == "WIN" or (hasattr(layer, "_layers") and _win_showing(layer))):
+            return True
+    return False
+
+def capture(program: str) -> tuple:
+    # returns the hashes of each state and of the whole run, along with the number of frames and the time spent rasterizing
+    session = runtime.Session(seconds=SECONDS, seed=SEED, script=[{"t": START_TIME, "serial": "\n"}], audio=False, neopixels=False)
+    hashes = {}
+    run = hashlib.sha1()
+    stats = [0, 0.]
+    rasterizer = None
+
+    def refreshed(display) -> None:
+        nonlocal rasterizer
+        if rasterizer is None:
+            rasterizer = Rasterizer(display.width, display.height)
+        started = time.perf_counter()
+        frame = rasterizer.render(display.root_group)
+        stats[0] += 1
+        stats[1] += time.perf_counter() - started
+        run.update(frame.tobytes())
+
+        now = session.clock.monotonic()
+        state = None
+        if now < START_TIME:
+            state = "serve"
+        elif now >= START_TIME + RALLY_DELAY:
+            state = "rally"
+        if state is not None and state not in hashes:
+            hashes[state] = hashlib.sha1(frame.tobytes()).hexdigest()[:16]
+        if display.root_group is not None and _win_showing(display.root_group):
+            hashes["win"] = hashlib.sha1(frame.tobytes()).hexdigest()[:16]
+            session.stop()
+
+    session.on_refresh(refreshed)
+    session.run(program)
+    hashes["run"] = run.hexdigest()[:16]
+    return hashes, stats[0], stats[1]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check the frames drawn by each program against golden hashes")
+    parser.add_argument("programs", nargs="*", default=["code.py"] + sorted(str(path.relative_to(ROOT)) for path in (ROOT / "guide").glob("*.py")))
+    parser.add_argument("--update", action="store_true", help="write the current hashes to the golden file")
+    parser.add_argument("--golden", default=str(GOLDEN_PATH))
+    args = parser.parse_args()
+
+    golden = {}
+    if Path(args.golden).exists():
+        with open(args.golden, "r") as f:
+            golden = json.load(f)
+
+    failures = 0
+    frames, elapsed = 0, 0.
+    for program in args.programs:
+        name = Path(program).as_posix()
+        hashes, program_frames, program_elapsed = capture(str(ROOT / program))
+        frames += program_frames
+        elapsed += program_elapsed
+        if args.update:
+            golden[name] = hashes
+            print("{:32s} {}".format(name, " ".join("{}={}".format(state, value) for state, value in hashes.items())))
+            continue
+        expected = golden.get(name, {})
+        mismatches = 0
+        for state in sorted(set(hashes) | set(expected)):
+            if hashes.get(state) != expected.get(state):
+                print("{:32s} {:6s} expected {} got {}".format(name, state, expected.get(state), hashes.get(state)))
+                mismatches += 1
+        failures += mismatches
+        if not mismatches:
+            print("{:32s} ok".format(name))
+
+    print("{:d} frames rasterized at {:.0f} frames per minute".format(frames, frames / elapsed * 60 if elapsed else 0))
+    if args.update:
+        with open(args.golden, "w") as f:
+            json.dump(golden, f, indent=2)
+            f.write("\n")
+    elif failures:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+# Draws the displayio layer tree built by a program on the host shims into a NumPy frame of RGB
+# pixels, `uint8` with a shape of (height, width, 3). Every layer is drawn with whole-array slice
+# operations rather than per pixel, and text is laid out once per distinct string and font, so a
+# 320x240 frame of the game takes a couple hundred microseconds. Covers what the game and the
+# guide stages display: nested (scaled) groups, `vectorio.Rectangle` and `vectorio.Circle`,
+# `displayio.TileGrid` of a `displayio.Bitmap` and `Label` text, along with the `hidden` flag of
+# each and palette transparency. Requires numpy (`pip install numpy`).
+
+import hashlib
+
+import numpy
+
+class Rasterizer:
+    def __init__(self, width: int, height: int, background: int = 0x000000):
+        self.width = width
+        self.height = height
+        self.frame = numpy.zeros((height, width, 3), dtype=numpy.uint8)
+        self._background = numpy.empty_like(self.frame)
+        self._background[:] = _rgb(background)  # copied in whole, broadcasting a color each frame is far slower
+        self._text = {}  # (font, text) -> mask of the laid out glyphs
+
+    def render(self, group) -> numpy.ndarray:
+        # redraws `group` into `self.frame` and returns it, copy the frame to keep it
+        numpy.copyto(self.frame, self._background)
+        if group is not None:
+            self._group(group, 0, 0, 1)
+        return self.frame
+
+    def hash(self, group) -> str:
+        return hashlib.sha1(self.render(group).tobytes()).hexdigest()[:16]
+
+    def _group(self, group, x: int, y: int, scale: int) -> None:
+        if group.hidden:
+            return
+        x, y = x + group.x * scale, y + group.y * scale
+        scale *= group.scale
+        if hasattr(group, "font") and hasattr(group, "text"):  # Label
+            self._label(group, x, y, scale)
+        for layer in group:
+            if layer.hidden:
+                continue
+            if hasattr(layer, "_layers"):  # Group
+                self._group(layer, x, y, scale)
+            elif hasattr(layer, "radius"):
+                self._circle(layer, x, y, scale)
+            elif hasattr(layer, "tile_width"):
+                self._tilegrid(layer, x, y, scale)
+            elif hasattr(layer, "width"):
+                self._rectangle(layer, x, y, scale)
+
+    def _fill(self, x: int, y: int, mask: numpy.ndarray, color: numpy.ndarray) -> None:
+        # paints `color` wherever `mask` is set with its top left corner at x, y
+        height, width = mask.shape
+        x1, y1 = max(x, 0), max(y, 0)
+        x2, y2 = min(x + width, self.width), min(y + height, self.height)
+        if x1 < x2 and y1 < y2:
+            self.frame[y1:y2, x1:x2][mask[y1 - y:y2 - y, x1 - x:x2 - x]] = color
+
+    def _paint(self, x: int, y: int, pixels: numpy.ndarray, opaque: numpy.ndarray) -> None:
+        # copies (height, width, 3) `pixels` wherever `opaque` is set
+        height, width = opaque.shape
+        x1, y1 = max(x, 0), max(y, 0)
+        x2, y2 = min(x + width, self.width), min(y + height, self.height)
+        if x1 < x2 and y1 < y2:
+            region = (slice(y1 - y, y2 - y), slice(x1 - x, x2 - x))
+            mask = opaque[region]
+            self.frame[y1:y2, x1:x2][mask] = pixels[region][mask]
+
+    def _shape_color(self, shape) -> numpy.ndarray:
+        palette = shape.pixel_shader
+        if palette.is_transparent(shape.color_index):
+            return None
+        return _rgb(palette[shape.color_index])
+
+    def _rectangle(self, rectangle, x: int, y: int, scale: int) -> None:
+        color = self._shape_color(rectangle)
+        if color is None:
+            return
+        x1, y1 = max(x + rectangle.x * scale, 0), max(y + rectangle.y * scale, 0)
+        x2 = min(x + (rectangle.x + rectangle.width) * scale, self.width)
+        y2 = min(y + (rectangle.y + rectangle.height) * scale, self.height)
+        if x1 < x2 and y1 < y2:
+            self.frame[y1:y2, x1:x2] = color
+
+    def _circle(self, circle, x: int, y: int, scale: int) -> None:
+        color = self._shape_color(circle)
+        if color is None:
+            return
+        r = circle.radius
+        j, i = numpy.ogrid[-r:r + 1, -r:r + 1]
+        mask = i * i + j * j <= r * r
+        self._fill(x + (circle.x - r) * scale, y + (circle.y - r) * scale, _scale(mask, scale), color)
+
+    def _tilegrid(self, tilegrid, x: int, y: int, scale: int) -> None:
+        bitmap, palette = tilegrid.bitmap, tilegrid.pixel_shader
+        if not hasattr(bitmap, "_data") or not hasattr(palette, "_colors"):
+            return  # only bitmaps with pixels behind a palette can be drawn
+        pixels = numpy.frombuffer(bitmap._data, dtype=numpy.dtype(bitmap._data.typecode)).reshape(bitmap.height, bitmap.width)
+        colors = numpy.array([_rgb(color) for color in palette._colors], dtype=numpy.uint8)
+        transparent = numpy.array(palette._transparent, dtype=bool)
+
+        # gather the tiles into one image of indices
+        tile_width, tile_height = tilegrid.tile_width, tilegrid.tile_height
+        columns = bitmap.width // tile_width
+        tiles = numpy.frombuffer(tilegrid._tiles, dtype=numpy.uint16).reshape(tilegrid.height, tilegrid.width)
+        sheet = pixels[:bitmap.height // tile_height * tile_height, :columns * tile_width].reshape(
+            bitmap.height // tile_height, tile_height, columns, tile_width,
+        )
+        image = sheet[tiles // columns, :, tiles % columns, :]  # (rows, columns, tile_height, tile_width)
+        image = image.transpose(0, 2, 1, 3).reshape(tilegrid.height * tile_height, tilegrid.width * tile_width)
+        if tilegrid.transpose_xy:
+            image = image.T
+        if tilegrid.flip_x:
+            image = image[:, ::-1]
+        if tilegrid.flip_y:
+            image = image[::-1]
+
+        image = _scale(numpy.minimum(image, len(colors) - 1), scale)
+        self._paint(x + tilegrid.x * scale, y + tilegrid.y * scale, colors[image], ~transparent[image])
+
+    def _label(self, label, x: int, y: int, scale: int) -> None:
+        key = (label.font, label.text)
+        if (mask := self._text.get(key)) is None:
+            mask = self._text[key] = _layout(label.font, label.text)
+        top = label.bounding_box[1]
+        if label.background_color is not None:
+            background = numpy.ones(mask.shape, dtype=bool)
+            self._fill(x, y + top * scale, _scale(background, scale), _rgb(label.background_color))
+        self._fill(x, y + top * scale, _scale(mask, scale), _rgb(label.color))
+
+def _rgb(color: int) -> numpy.ndarray:
+    return numpy.array(((color >> 16) & 0xff, (color >> 8) & 0xff, color & 0xff), dtype=numpy.uint8)
+
+def _scale(image: numpy.ndarray, scale: int) -> numpy.ndarray:
+    if scale == 1:
+        return image
+    return image.repeat(scale, axis=0).repeat(scale, axis=1)
+
+def _layout(font, text: str) -> numpy.ndarray:
+    # lays out a single line of fixed width glyphs from the font's glyph strip
+    width, height = font.get_bounding_box()[:2]
+    mask = numpy.zeros((height, width * len(text)), dtype=bool)
+    for i, character in enumerate(text):
+        if (glyph := font.get_glyph(ord(character))) is None:
+            continue
+        strip = glyph.bitmap
+        pixels = numpy.frombuffer(strip._data, dtype=numpy.dtype(strip._data.typecode)).reshape(strip.height, strip.width)
+        x = glyph.tile_index * glyph.width
+        mask[:glyph.height, i * width:i * width + glyph.width] = pixels[:glyph.height, x:x + glyph.width] != 0
+    return mask
@@ -0,0 +1,35 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+# usage: python -m host.run [code.py | guide/N_*.py] [--seconds 60] [--start] [--script inputs.jsonl]
+
+import argparse
+
+from host import runtime
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run a Fruit Jam Pong program on the host")
+    parser.add_argument("program", nargs="?", default="code.py")
+    parser.add_argument("--seconds", type=float, default=60, help="simulated seconds to run for")
+    parser.add_argument("--realtime", action="store_true", help="run on the wall clock instead of the turbo clock")
+    parser.add_argument("--seed", type=int, help="seed for the random module")
+    parser.add_argument("--script", help="json lines file of timed input events")
+    parser.add_argument("--start", action="store_true", help="press enter shortly after starting")
+    parser.add_argument("--no-audio", action="store_true")
+    parser.add_argument("--no-neopixels", action="store_true")
+    args = parser.parse_args()
+
+    script = runtime.load_script(args.script) if args.script else []
+    if args.start:
+        script.append({"t": .1, "serial": "\n"})
+
+    session = runtime.Session(
+        turbo=not args.realtime, seconds=args.seconds, seed=args.seed, script=script,
+        audio=not args.no_audio, neopixels=not args.no_neopixels,
+    )
+    session.run(args.program)
+    print(session.summary())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+# Runs `code.py` (or any `guide/N_*.py` stage) unmodified under CPython by putting the stand-in
+# modules within `host/shims` ahead of everything else on the module path. The "turbo" clock
+# replaces the asyncio event loop time with a virtual clock which jumps straight to the next
+# scheduled callback, so `asyncio.sleep(1/30)` returns at once while the game still sees 30 Hz.
+
+import asyncio
+import json
+import os
+from pathlib import Path
+import random
+import selectors
+import sys
+import time
+
+SHIMS_DIRECTORY = Path(__file__).parent / "shims"
+
+# supervisor.ticks_ms() wraps at 2**29 and starts 65 seconds before the first wrap
+TICKS_PERIOD = 1 << 29
+TICKS_MASK = TICKS_PERIOD - 1
+TICKS_OFFSET = TICKS_PERIOD - 65536
+
+# rate at which the display is refreshed in the background while `auto_refresh` is on
+AUTO_REFRESH_RATE = 60
+
+# the session currently being run, shared with the shim modules
+session = None
+
+class Reload(SystemExit):
+    # raised by `supervisor.reload()` to end the session
+    pass
+
+class Clock:
+    def __init__(self, turbo: bool = True):
+        self.turbo = turbo
+        self._now = 0.
+        self._origin = time.monotonic()
+
+    def monotonic(self) -> float:
+        return self._now if self.turbo else time.monotonic() - self._origin
+
+    def advance(self, seconds: float) -> None:
+        if self.turbo:
+            self._now += seconds
+        elif seconds > 0:
+            time.sleep(seconds)
+
+    def ticks_ms(self) -> int:
+        return (int(self.monotonic() * 1000) + TICKS_OFFSET) & TICKS_MASK
+
+class Serial:
+    # stands in for `sys.stdin` and `supervisor.runtime.serial_bytes_available`
+    def __init__(self):
+        self._buffer = ""
+
+    def write(self, data: str) -> None:
+        self._buffer += data
+
+    @property
+    def in_waiting(self) -> int:
+        return len(self._buffer)
+
+    def read(self, size: int = 1) -> str:
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+class GamepadDevice:
+    def __init__(self):
+        self.connected = False
+        self.buttons = set()
+        self.reports = 0  # reports sent by the device but not yet read by the host
+
+class MouseDevice:
+    def __init__(self):
+        self.connected = False
+        self.buttons = []
+        self.dx = self.dy = 0
+        self.reports = 0
+
+# usb hid usage ids of the keys which scripts can hold by name
+KEY_CODES = {
+    "A": 0x04, "D": 0x07, "S": 0x16, "W": 0x1a,
+    "ENTER": 0x28, "ESCAPE": 0x29, "SPACE": 0x2c,
+    "RIGHT": 0x4f, "LEFT": 0x50, "DOWN": 0x51, "UP": 0x52,
+}
+
+class KeyboardDevice:
+    def __init__(self):
+        self.connected = False
+        self.keys = []  # usage ids of the held keys, at most 6 fit in a boot report
+        self.reports = 0
+
+class Inputs:
+    def __init__(self):
+        self.serial = Serial()
+        self.buttons = [False, False, False]
+        self.button_events = []  # (button, pressed, ticks) as a background scanner would queue them
+        self.gamepads = {}
+        self.mouse = MouseDevice()
+        self.keyboard = KeyboardDevice()
+
+    def gamepad(self, port: int) -> GamepadDevice:
+        if port not in self.gamepads:
+            self.gamepads[port] = GamepadDevice()
+        return self.gamepads[port]
+
+    def apply(self, event: dict, ticks: int = 0) -> None:
+        if "serial" in event:
+            self.serial.write(event["serial"])
+        if "button" in event:
+            button, pressed = event["button"] - 1, bool(event.get("pressed", True))
+            if self.buttons[button] != pressed:
+                self.button_events.append((button, pressed, ticks))
+            self.buttons[button] = pressed
+        if "gamepad" in event:
+            gamepad = self.gamepad(event["gamepad"])
+            gamepad.connected = event.get("connected", True)
+            if "buttons" in event:
+                gamepad.buttons = set(event["buttons"])
+            gamepad.reports += 1
+        if "mouse" in event:
+            mouse = self.mouse
+            mouse.connected = event["mouse"].get("connected", True)
+            mouse.buttons = list(event["mouse"].get("buttons", mouse.buttons))
+            mouse.dx += event["mouse"].get("dx", 0)
+            mouse.dy += event["mouse"].get("dy", 0)
+            mouse.reports += 1
+        if "keyboard" in event:
+            keyboard = self.keyboard
+            keyboard.connected = event["keyboard"].get("connected", True)
+            if "keys" in event["keyboard"]:
+                keyboard.keys = [KEY_CODES[key] if isinstance(key, str) else key for key in event["keyboard"]["keys"]]
+            keyboard.reports += 1
+
+def load_script(path: str) -> list:
+    # one json event per line, ie: {"t": 0.5, "serial": "\n"}
+    with open(path, "r") as f:
+        return [json.loads(line) for line in f if line.strip() and not line.lstrip().startswith("#")]
+
+class _TurboSelector:
+    def __init__(self, session, selector: selectors.BaseSelector):
+        self._session = session
+        self._selector = selector
+
+    def __getattr__(self, name: str):
+        return getattr(self._selector, name)
+
+    def select(self, timeout: float = None) -> list:
+        self._session._check_stop()
+        if self._session.clock.turbo:
+            if timeout is None:  # nothing will ever wake us up again
+                self._session.stop()
+                self._session._check_stop()
+            elif timeout > 0:
+                self._session.clock.advance(timeout)
+                timeout = 0
+        return self._selector.select(timeout)
+
+class TurboEventLoop(asyncio.SelectorEventLoop):
+    def __init__(self, session):
+        self._session = session
+        super().__init__(_TurboSelector(session, selectors.DefaultSelector()))
+
+    def time(self) -> float:
+        return self._session.clock.monotonic()
+
+class _EventLoopPolicy(asyncio.DefaultEventLoopPolicy):
+    def __init__(self, session):
+        super().__init__()
+        self._session = session
+
+    def new_event_loop(self) -> asyncio.AbstractEventLoop:
+        loop = TurboEventLoop(self._session)
+        self._session._start(loop)
+        return loop
+
+class Session:
+    def __init__(self, turbo: bool = True, seconds: float = None, seed: int = None,
+                 script: list = (), audio: bool = True, neopixels: bool = True):
+        self.clock = Clock(turbo)
+        self.inputs = Inputs()
+        self.seconds = seconds
+        self.seed = seed
+        self.script = sorted(script, key=lambda event: event.get("t", 0))
+        self.audio = audio
+        self.neopixels = neopixels
+
+        self.display = None
+        self.namespace = None
+        self.loop = None
+        self.refreshes = 0
+        self.reloaded = False
+        self.wall_time = 0.
+
+        self._start_hooks = []
+        self._refresh_hooks = []
+        self._stopping = False
+        self._stopped = False
+
+    # call hook(namespace) once the program has been loaded and its event loop is starting
+    def on_start(self, hook) -> None:
+        self._start_hooks.append(hook)
+
+    # call hook(display) every time the display is refreshed
+    def on_refresh(self, hook) -> None:
+        self._refresh_hooks.append(hook)
+
+    def stop(self) -> None:
+        self._stopping = True
+
+    def _check_stop(self) -> None:
+        if self._stopped:
+            return
+        if self._stopping or (self.seconds is not None and self.clock.monotonic() >= self.seconds):
+            self._stopped = True
+            raise KeyboardInterrupt
+
+    def _start(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        loop.set_exception_handler(self._exception_handler)
+        for event in self.script:
+            loop.call_at(event.get("t", 0), self._apply, event)
+        loop.call_soon(self._auto_refresh)
+        for hook in self._start_hooks:
+            hook(self.namespace)
+
+    @staticmethod
+    def _exception_handler(loop: asyncio.AbstractEventLoop, context: dict) -> None:
+        if not isinstance(context.get("exception"), Reload):  # reloads are reported by the session
+            loop.default_exception_handler(context)
+
+    def _apply(self, event: dict) -> None:
+        if event.get("stop"):
+            self.stop()
+        else:
+            self.inputs.apply(event, self.clock.ticks_ms())
+
+    def _auto_refresh(self) -> None:
+        if self.display is not None and self.display.auto_refresh:
+            self.display._refresh()
+        self.loop.call_later(1 / AUTO_REFRESH_RATE, self._auto_refresh)
+
+    def _refreshed(self, display) -> None:
+        self.refreshes += 1
+        for hook in self._refresh_hooks:
+            hook(display)
+
+    def run(self, path: str) -> dict:
+        global session
+        path = Path(path).resolve()
+
+        previous_session = session
+        previous_cwd = os.getcwd()
+        previous_path = list(sys.path)
+        previous_stdin = sys.stdin
+        previous_policy = asyncio.get_event_loop_policy()
+        previous_modules = set(sys.modules)
+
+        session = self
+        sys.path[:0] = [str(SHIMS_DIRECTORY), str(path.parent)]
+        sys.stdin = self.inputs.serial
+        os.chdir(path.parent)
+        asyncio.set_event_loop_policy(_EventLoopPolicy(self))
+        if self.seed is not None:
+            random.seed(self.seed)
+
+        self.namespace = {"__name__": "__main__", "__file__": str(path)}
+        started = time.perf_counter()
+        try:
+            exec(compile(path.read_text(), str(path), "exec"), self.namespace)
+        except Reload:
+            self.reloaded = True
+        finally:
+            self.wall_time = time.perf_counter() - started
+            asyncio.set_event_loop_policy(previous_policy)
+            os.chdir(previous_cwd)
+            sys.stdin = previous_stdin
+            sys.path[:] = previous_path
+            for name in set(sys.modules) - previous_modules:  # leave no shim or program state behind
+                del sys.modules[name]
+            session = previous_session
+        return self.namespace
+
+    def summary(self) -> str:
+        seconds = self.clock.monotonic()
+        return "{:.1f} s simulated in {:.2f} s ({:.0f}x), {:d} display refreshes{}".format(
+            seconds, self.wall_time, seconds / self.wall_time if self.wall_time else 0,
+            self.refreshes, ", reloaded" if self.reloaded else "",
+        )
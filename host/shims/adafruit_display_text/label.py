@@ -0,0 +1,62 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+# host stand-in for `adafruit_display_text.label`
+
+import displayio
+
+class Label(displayio.Group):
+    def __init__(self, font, *, text: str = "", color: int = 0xffffff, background_color: int = None,
+                 scale: int = 1, anchor_point: tuple = None, anchored_position: tuple = None,
+                 x: int = 0, y: int = 0, **kwargs):
+        super().__init__(scale=scale, x=x, y=y)
+        self.font = font
+        self.color = color
+        self.background_color = background_color
+        self._anchor_point = anchor_point
+        self._anchored_position = anchored_position
+        self._text = None
+        self._bounding_box = (0, 0, 0, 0)
+        self.text = text
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    @text.setter
+    def text(self, value: str) -> None:
+        self._text = str(value)
+        width, height = self.font.get_bounding_box()[:2]
+        # the label origin sits on the vertical center of the line like the real library
+        self._bounding_box = (0, -(height // 2), width * len(self._text), height)
+        self._update_position()
+
+    @property
+    def bounding_box(self) -> tuple:
+        return self._bounding_box
+
+    @property
+    def anchor_point(self) -> tuple:
+        return self._anchor_point
+
+    @anchor_point.setter
+    def anchor_point(self, value: tuple) -> None:
+        self._anchor_point = value
+        self._update_position()
+
+    @property
+    def anchored_position(self) -> tuple:
+        return self._anchored_position
+
+    @anchored_position.setter
+    def anchored_position(self, value: tuple) -> None:
+        self._anchored_position = value
+        self._update_position()
+
+    def _update_position(self) -> None:
+        if self._anchor_point is None or self._anchored_position is None:
+            return
+        x, y, width, height = self._bounding_box
+        self.x = int(self._anchored_position[0] - x * self.scale - round(self._anchor_point[0] * width * self.scale))
+        self.y = int(self._anchored_position[1] - y * self.scale - round(self._anchor_point[1] * height * self.scale))
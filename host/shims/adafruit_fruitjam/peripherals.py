@@ -0,0 +1,148 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+# host stand-in for `adafruit_fruitjam.peripherals`
+
+import os
+
+from host import runtime as _host
+import framebufferio
+import supervisor
+
+NEOPIXEL_COUNT = 5
+
+def request_display_config(width: int = None, height: int = None, color_depth: int = None) -> None:
+    if width is None:
+        width = os.getenv("CIRCUITPY_DISPLAY_WIDTH")
+        if width is None:
+            raise ValueError("No CIRCUITPY_DISPLAY_WIDTH specified in settings.toml")
+        width = int(width)
+    if height is None:
+        height = {720: 400, 640: 480, 360: 200, 320: 240}.get(width, width * 3 // 4)
+    display = framebufferio.FramebufferDisplay(
+        width=width, height=height, color_depth=(color_depth or 16),
+    )
+    supervisor.runtime.display = _host.session.display = display
+
+class NeoPixel:
+    def __init__(self, n: int, *, brightness: float = 1., auto_write: bool = True):
+        self.n = n
+        self.brightness = brightness
+        self.auto_write = auto_write
+        self.shows = 0
+        self._pixels = [0] * n
+        self.shown = [0] * n  # what is currently lit up on the strip
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __getitem__(self, index: int) -> tuple:
+        value = self._pixels[index]
+        return ((value >> 16) & 0xff, (value >> 8) & 0xff, value & 0xff)
+
+    def __setitem__(self, index: int, value) -> None:
+        if not isinstance(value, int):
+            value = (value[0] << 16) | (value[1] << 8) | value[2]
+        self._pixels[index] = value & 0xffffff
+        if self.auto_write:
+            self.show()
+
+    def fill(self, value) -> None:
+        auto_write, self.auto_write = self.auto_write, False
+        for i in range(self.n):
+            self[i] = value
+        self.auto_write = auto_write
+        if self.auto_write:
+            self.show()
+
+    def show(self) -> None:
+        self.shows += 1
+        self.shown = list(self._pixels)
+
+    def deinit(self) -> None:
+        pass
+
+class _Audio:
+    def __init__(self):
+        self.sample = None
+
+    def play(self, sample, *, loop: bool = False) -> None:
+        self.sample = sample
+
+    def stop(self) -> None:
+        self.sample = None
+
+    @property
+    def playing(self) -> bool:
+        return self.sample is not None
+
+    def deinit(self) -> None:
+        self.stop()
+
+class _Button:
+    # stands in for the DigitalInOut of each button pin
+    def __init__(self, index: int):
+        self._index = index
+        self._deinited = False
+
+    @property
+    def value(self) -> bool:
+        if self._deinited:
+            raise ValueError("Object has been deinitialized and can no longer be used")
+        return not _host.session.inputs.buttons[self._index]  # pulled up, low when pressed
+
+    def deinit(self) -> None:
+        self._deinited = True
+
+class Peripherals:
+    def __init__(self, audio_output: str = "headphone", safe_volume_limit: int = 12,
+                 sample_rate: int = 11025, bit_depth: int = 16, i2c=None):
+        self.safe_volume_limit = safe_volume_limit
+        self.sample_rate = sample_rate
+        self.bit_depth = bit_depth
+        self.audio_output = audio_output
+        self._volume = 7
+        self._audio = _Audio() if _host.session.audio else None
+        self._neopixels = NeoPixel(NEOPIXEL_COUNT, brightness=.1) if _host.session.neopixels else None
+        self._buttons = [_Button(i) for i in range(3)]
+
+    @property
+    def audio(self):
+        return self._audio
+
+    @property
+    def neopixels(self):
+        return self._neopixels
+
+    @property
+    def button1(self) -> bool:
+        return not self._buttons[0].value
+
+    @property
+    def button2(self) -> bool:
+        return not self._buttons[1].value
+
+    @property
+    def button3(self) -> bool:
+        return not self._buttons[2].value
+
+    @property
+    def any_button_pressed(self) -> bool:
+        return any(not button.value for button in self._buttons)
+
+    @property
+    def volume(self) -> int:
+        return self._volume
+
+    @volume.setter
+    def volume(self, value: int) -> None:
+        if value > self.safe_volume_limit:
+            raise ValueError("Volume exceeds safe limit")
+        self._volume = value
+
+    def deinit(self) -> None:
+        if self._audio is not None:
+            self._audio.deinit()
+        if self._neopixels is not None:
+            self._neopixels.deinit()
@@ -0,0 +1,7 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+# host stand-in for `adafruit_pathlib`
+
+from pathlib import Path
@@ -0,0 +1,14 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+# host stand-in for `adafruit_usb_host_descriptors`
+
+import usb.core
+
+def find_boot_keyboard_endpoint(device: usb.core.Device) -> tuple:
+    # returns (interface index, endpoint address) or (None, None)
+    return (0, 0x81) if isinstance(device, usb.core.Device) else (None, None)
+
+def find_boot_mouse_endpoint(device: usb.core.Device) -> tuple:
+    return (None, None)
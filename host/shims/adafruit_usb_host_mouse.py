@@ -0,0 +1,73 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+# host stand-in for `adafruit_usb_host_mouse`, backed by the scripted mouse of the host session
+
+from host import runtime as _host
+import displayio
+import supervisor
+import usb.core
+
+BUTTONS = ("left", "right", "middle")
+
+class _Device:
+    # hands out the scripted motion as boot protocol reports of at most 127 counts per axis
+    def read(self, endpoint: int, buffer, timeout: int = None) -> int:
+        device = _host.session.inputs.mouse
+        if not device.connected:
+            raise usb.core.USBError("No device")
+        if not device.reports:
+            raise usb.core.USBTimeoutError()
+        buffer[0] = sum(1 << i for i, button in enumerate(BUTTONS) if button in device.buttons)
+        buffer[1] = dx = min(max(device.dx, -127), 127)
+        buffer[2] = dy = min(max(device.dy, -127), 127)
+        device.dx -= dx
+        device.dy -= dy
+        if not device.dx and not device.dy:
+            device.reports = 0
+        return 4
+
+class BootMouse:
+    def __init__(self, tilegrid: displayio.TileGrid, scale: int = 1):
+        self.device = _Device()
+        self.endpoint = 0x81
+        self.tilegrid = tilegrid
+        self.scale = scale
+        self.sensitivity = 1
+        self.display_size = (supervisor.runtime.display.width, supervisor.runtime.display.height)
+
+    @property
+    def x(self) -> int:
+        return self.tilegrid.x
+
+    @x.setter
+    def x(self, value: int) -> None:
+        self.tilegrid.x = min(max(value, 0), self.display_size[0] - 1)
+
+    @property
+    def y(self) -> int:
+        return self.tilegrid.y
+
+    @y.setter
+    def y(self, value: int) -> None:
+        self.tilegrid.y = min(max(value, 0), self.display_size[1] - 1)
+
+    def update(self) -> list:
+        device = _host.session.inputs.mouse
+        if not device.connected or not device.reports:  # read timed out
+            return None
+        self.x += device.dx * self.sensitivity
+        self.y += device.dy * self.sensitivity
+        device.dx = device.dy = device.reports = 0
+        return [button for button in BUTTONS if button in device.buttons]
+
+    def release(self) -> None:
+        pass
+
+def find_and_init_boot_mouse(cursor_image: str = "/launcher_assets/mouse_cursor.bmp") -> BootMouse:
+    if not _host.session.inputs.mouse.connected:
+        return None
+    bitmap = displayio.Bitmap(8, 14, 2)
+    tilegrid = displayio.TileGrid(bitmap, pixel_shader=displayio.Palette(2))
+    return BootMouse(tilegrid)
@@ -0,0 +1,20 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+# host stand-in for the CircuitPython `audiocore` module
+
+class RawSample:
+    def __init__(self, buffer, *, channel_count: int = 1, sample_rate: int = 8000, single_buffer: bool = True):
+        self.buffer = buffer
+        self.channel_count = channel_count
+        self.sample_rate = sample_rate
+        self.single_buffer = single_buffer
+
+    @property
+    def _duration(self) -> float:
+        # lets the host mixer stop playing once the sample has finished
+        return len(self.buffer) / self.channel_count / self.sample_rate
+
+    def deinit(self) -> None:
+        self.buffer = None
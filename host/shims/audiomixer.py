@@ -0,0 +1,51 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+# host stand-in for the CircuitPython `audiomixer` module
+
+from host import runtime as _host
+
+class MixerVoice:
+    def __init__(self):
+        self.level = 1.
+        self.loop = False
+        self.sample = None
+        self._ends = None
+
+    def play(self, sample, *, loop: bool = False) -> None:
+        self.sample = sample
+        self.loop = loop
+        # samples with a known length stop on their own, everything else plays until stopped
+        duration = getattr(sample, "_duration", None)
+        self._ends = None if loop or duration is None else _host.session.clock.monotonic() + duration
+
+    def stop(self) -> None:
+        self.sample = None
+
+    @property
+    def playing(self) -> bool:
+        if self.sample is not None and self._ends is not None and _host.session.clock.monotonic() >= self._ends:
+            self.sample = None
+        return self.sample is not None
+
+class Mixer:
+    def __init__(self, voice_count: int = 2, buffer_size: int = 1024, channel_count: int = 2,
+                 bits_per_sample: int = 16, samples_signed: bool = True, sample_rate: int = 8000):
+        # only the attributes which the real mixer exposes, so that code relying on others fails here too
+        self.sample_rate = sample_rate
+        self.voice = tuple(MixerVoice() for i in range(voice_count))
+
+    def play(self, sample, *, voice: int = 0, loop: bool = False) -> None:
+        self.voice[voice].play(sample, loop=loop)
+
+    def stop_voice(self, voice: int = 0) -> None:
+        self.voice[voice].stop()
+
+    @property
+    def playing(self) -> bool:
+        return any(voice.playing for voice in self.voice)
+
+    def deinit(self) -> None:
+        for voice in self.voice:
+            voice.stop()
@@ -0,0 +1,33 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+# host stand-in for the CircuitPython `bitmaptools` module
+
+import array
+
+def fill_region(dest_bitmap, x1: int, y1: int, x2: int, y2: int, value: int) -> None:
+    # x2 and y2 are exclusive
+    x1, x2 = sorted((max(min(x1, dest_bitmap.width), 0), max(min(x2, dest_bitmap.width), 0)))
+    y1, y2 = sorted((max(min(y1, dest_bitmap.height), 0), max(min(y2, dest_bitmap.height), 0)))
+    if x1 == x2 or y1 == y2:
+        return
+    row = array.array(dest_bitmap._data.typecode, [value] * (x2 - x1))
+    for y in range(y1, y2):
+        offset = y * dest_bitmap.width
+        dest_bitmap._data[offset + x1:offset + x2] = row
+    dest_bitmap.dirty(x1, y1, x2, y2)
+
+def blit(dest_bitmap, source_bitmap, x: int, y: int, *, x1: int = 0, y1: int = 0, x2: int = None, y2: int = None,
+         skip_source_index: int = None, skip_dest_index: int = None) -> None:
+    x2 = source_bitmap.width if x2 is None else x2
+    y2 = source_bitmap.height if y2 is None else y2
+    for j in range(y1, y2):
+        for i in range(x1, x2):
+            dx, dy = x + i - x1, y + j - y1
+            if not (0 <= dx < dest_bitmap.width and 0 <= dy < dest_bitmap.height):
+                continue
+            value = source_bitmap[i, j]
+            if value == skip_source_index or dest_bitmap[dx, dy] == skip_dest_index:
+                continue
+            dest_bitmap[dx, dy] = value
@@ -0,0 +1,17 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+# host stand-in for the Fruit Jam `board` module, only the pins used by this project
+
+class Pin:
+    def __init__(self, name: str, button: int = None):
+        self.name = name
+        self._button = button  # index of the scripted hardware button
+
+    def __repr__(self) -> str:
+        return "board." + self.name
+
+BUTTON1 = Pin("BUTTON1", 0)
+BUTTON2 = Pin("BUTTON2", 1)
+BUTTON3 = Pin("BUTTON3", 2)
@@ -0,0 +1,176 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+# host stand-in for the CircuitPython `displayio` module
+
+import array
+import struct
+
+import supervisor
+
+def release_displays() -> None:
+    supervisor.runtime.display = None
+
+class Group:
+    def __init__(self, *, scale: int = 1, x: int = 0, y: int = 0):
+        self.scale = scale
+        self.x = x
+        self.y = y
+        self.hidden = False
+        self._layers = []
+
+    def append(self, layer) -> None:
+        self._layers.append(layer)
+
+    def insert(self, index: int, layer) -> None:
+        self._layers.insert(index, layer)
+
+    def index(self, layer) -> int:
+        return self._layers.index(layer)
+
+    def remove(self, layer) -> None:
+        self._layers.remove(layer)
+
+    def pop(self, index: int = -1):
+        return self._layers.pop(index)
+
+    def sort(self, key=None, reverse: bool = False) -> None:
+        self._layers.sort(key=key, reverse=reverse)
+
+    def __len__(self) -> int:
+        return len(self._layers)
+
+    def __getitem__(self, index: int):
+        return self._layers[index]
+
+    def __setitem__(self, index: int, layer) -> None:
+        self._layers[index] = layer
+
+    def __delitem__(self, index: int) -> None:
+        del self._layers[index]
+
+    def __iter__(self):
+        return iter(self._layers)
+
+    def __contains__(self, layer) -> bool:
+        return layer in self._layers
+
+def _color(value) -> int:
+    if isinstance(value, int):
+        return value & 0xffffff
+    r, g, b = value[:3]
+    return (r << 16) | (g << 8) | b
+
+class Palette:
+    def __init__(self, color_count: int, *, dither: bool = False):
+        self.dither = dither
+        self._colors = [0] * color_count
+        self._transparent = [False] * color_count
+
+    def __len__(self) -> int:
+        return len(self._colors)
+
+    def __getitem__(self, index: int) -> int:
+        return self._colors[index]
+
+    def __setitem__(self, index: int, value) -> None:
+        self._colors[index] = _color(value)
+
+    def make_transparent(self, index: int) -> None:
+        self._transparent[index] = True
+
+    def make_opaque(self, index: int) -> None:
+        self._transparent[index] = False
+
+    def is_transparent(self, index: int) -> bool:
+        return self._transparent[index]
+
+class ColorConverter:
+    def __init__(self, *, input_colorspace=None, dither: bool = False):
+        self.dither = dither
+        self._transparent = None
+
+    def convert(self, color: int) -> int:
+        return color
+
+    def make_transparent(self, color: int) -> None:
+        self._transparent = color
+
+    def make_opaque(self, color: int) -> None:
+        self._transparent = None
+
+class Bitmap:
+    def __init__(self, width: int, height: int, value_count: int):
+        self.width = width
+        self.height = height
+        self.value_count = value_count
+        self._data = array.array("B" if value_count <= 256 else "H", bytes(width * height * (1 if value_count <= 256 else 2)))
+        self._dirty_area = None  # x1, y1, x2, y2 of everything changed since the last refresh, like displayio tracks it
+
+    def _index(self, index) -> int:
+        if isinstance(index, tuple):
+            return index[1] * self.width + index[0]
+        return index
+
+    def __getitem__(self, index) -> int:
+        return self._data[self._index(index)]
+
+    def __setitem__(self, index, value: int) -> None:
+        index = self._index(index)
+        self._data[index] = value
+        x, y = index % self.width, index // self.width
+        self.dirty(x, y, x + 1, y + 1)
+
+    def fill(self, value: int) -> None:
+        for i in range(len(self._data)):
+            self._data[i] = value
+        self.dirty()
+
+    def dirty(self, x1: int = 0, y1: int = 0, x2: int = -1, y2: int = -1) -> None:
+        if x2 == -1:
+            x2 = self.width
+        if y2 == -1:
+            y2 = self.height
+        if self._dirty_area is not None:
+            x1, y1 = min(x1, self._dirty_area[0]), min(y1, self._dirty_area[1])
+            x2, y2 = max(x2, self._dirty_area[2]), max(y2, self._dirty_area[3])
+        self._dirty_area = (x1, y1, x2, y2)
+
+class OnDiskBitmap:
+    def __init__(self, file):
+        if isinstance(file, str):
+            with open(file, "rb") as f:
+                header = f.read(26)
+        else:
+            header = file.read(26)
+        self.width, self.height = struct.unpack_from("<ii", header, 18)
+        self.height = abs(self.height)
+        self.pixel_shader = ColorConverter()
+
+class TileGrid:
+    def __init__(self, bitmap, *, pixel_shader, width: int = 1, height: int = 1,
+                 tile_width: int = None, tile_height: int = None, default_tile: int = 0,
+                 x: int = 0, y: int = 0):
+        self.bitmap = bitmap
+        self.pixel_shader = pixel_shader
+        self.width = width
+        self.height = height
+        self.tile_width = tile_width if tile_width is not None else bitmap.width
+        self.tile_height = tile_height if tile_height is not None else bitmap.height
+        self.x = x
+        self.y = y
+        self.hidden = False
+        self.flip_x = self.flip_y = self.transpose_xy = False
+        self._tiles = array.array("H", [default_tile] * (width * height))
+
+    def _index(self, index) -> int:
+        if isinstance(index, tuple):
+            return index[1] * self.width + index[0]
+        return index
+
+    def __getitem__(self, index) -> int:
+        return self._tiles[self._index(index)]
+
+    def __setitem__(self, index, value: int) -> None:
+        self._tiles[self._index(index)] = value
@@ -0,0 +1,36 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+# host stand-in for `framebufferio`, the display type behind `supervisor.runtime.display`
+
+from host import runtime as _host
+
+class FramebufferDisplay:
+    def __init__(self, framebuffer=None, *, width: int = 320, height: int = 240,
+                 auto_refresh: bool = True, color_depth: int = 16):
+        self.width = width
+        self.height = height
+        self.color_depth = color_depth
+        self.auto_refresh = auto_refresh
+        self.root_group = None
+        self._last_refresh = None
+
+    def _refresh(self) -> None:
+        self._last_refresh = _host.session.clock.monotonic()
+        _host.session._refreshed(self)
+
+    def refresh(self, *, target_frames_per_second: int = None, minimum_frames_per_second: int = 0) -> bool:
+        clock = _host.session.clock
+        if not self.auto_refresh and target_frames_per_second and self._last_refresh is not None:
+            frame_time = 1 / target_frames_per_second
+            elapsed = clock.monotonic() - self._last_refresh
+            if minimum_frames_per_second and elapsed > 1 / minimum_frames_per_second:
+                raise RuntimeError("Below minimum frame rate")
+            if elapsed > frame_time:
+                # too late, skip this frame to catch up
+                self._last_refresh += frame_time * int(elapsed / frame_time)
+                return False
+            clock.advance(frame_time - elapsed)  # block until the target frame time
+        self._refresh()
+        return True
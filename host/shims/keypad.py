@@ -0,0 +1,66 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+# host stand-in for the CircuitPython `keypad` module, backed by the scripted buttons of the host session
+
+from host import runtime as _host
+
+class Event:
+    def __init__(self, key_number: int = 0, pressed: bool = True, timestamp: int = None):
+        self.key_number = key_number
+        self.pressed = pressed
+        self.released = not pressed
+        self.timestamp = timestamp
+
+class EventQueue:
+    def __init__(self, keys, max_events: int):
+        self._keys = keys
+        self._index = len(_host.session.inputs.button_events)  # only events after the scanner was created
+        self.max_events = max_events
+        self.overflowed = False
+
+    def _next(self):
+        # skips the events of buttons which aren't being scanned
+        events = _host.session.inputs.button_events
+        while self._index < len(events):
+            button, pressed, timestamp = events[self._index]
+            self._index += 1
+            if button in self._keys._buttons:
+                return self._keys._buttons.index(button), pressed, timestamp
+        return None
+
+    def get_into(self, event: Event) -> bool:
+        if (next_event := self._next()) is None:
+            return False
+        event.key_number, event.pressed, event.timestamp = next_event
+        event.released = not event.pressed
+        return True
+
+    def get(self) -> Event:
+        if (next_event := self._next()) is None:
+            return None
+        return Event(*next_event)
+
+    def clear(self) -> None:
+        self._index = len(_host.session.inputs.button_events)
+        self.overflowed = False
+
+    def __len__(self) -> int:
+        return sum(
+            1 for button, pressed, timestamp in _host.session.inputs.button_events[self._index:]
+            if button in self._keys._buttons
+        )
+
+class Keys:
+    def __init__(self, pins, *, value_when_pressed: bool, pull: bool = True, interval: float = .02,
+                 max_events: int = 64, debounce_threshold: int = 1):
+        self._buttons = [pin._button for pin in pins]
+        self.key_count = len(pins)
+        self.events = EventQueue(self, max_events)
+
+    def reset(self) -> None:
+        self.events.clear()
+
+    def deinit(self) -> None:
+        pass
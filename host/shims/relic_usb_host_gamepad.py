@@ -0,0 +1,44 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+# host stand-in for `relic_usb_host_gamepad`, backed by the scripted gamepads of the host session
+
+from host import runtime as _host
+
+class Buttons:
+    def __init__(self):
+        self._pressed = frozenset()
+
+    def __getattr__(self, name: str) -> bool:
+        if not name.isupper():
+            raise AttributeError(name)
+        # add a property for the button so that later reads don't raise and catch an AttributeError
+        # first, which would show up as an allocation in `host.alloc` that the device never makes
+        setattr(Buttons, name, property(lambda self: name in self._pressed))
+        return name in self._pressed
+
+class Gamepad:
+    def __init__(self, port: int = None):
+        self.port = port
+        self.buttons = Buttons()
+
+    @property
+    def _device(self) -> _host.GamepadDevice:
+        return _host.session.inputs.gamepad(self.port)
+
+    @property
+    def connected(self) -> bool:
+        return self._device.connected
+
+    def update(self) -> bool:
+        # reads one queued report, returns False if there was none or the device isn't connected
+        device = self._device
+        if not device.connected:
+            self.buttons._pressed = frozenset()
+            return False
+        if not device.reports:
+            return False
+        device.reports -= 1
+        self.buttons._pressed = frozenset(device.buttons)
+        return True
@@ -0,0 +1,39 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+# host stand-in for `relic_waveform` covering the generators used by the game
+
+import array
+import math
+import random
+
+MAX = 32767
+SIZE = 256
+
+def _waveform(values) -> array.array:
+    return array.array("h", [min(max(int(value), -MAX), MAX) for value in values])
+
+def sine(amplitude: float = 1., size: int = SIZE) -> array.array:
+    return _waveform(math.sin(2 * math.pi * i / size) * MAX * amplitude for i in range(size))
+
+def square(duty_cycle: float = .5, amplitude: float = 1., size: int = SIZE) -> array.array:
+    return _waveform((MAX if i < size * duty_cycle else -MAX) * amplitude for i in range(size))
+
+def saw(amplitude: float = 1., size: int = SIZE) -> array.array:
+    return _waveform((2 * i / (size - 1) - 1) * MAX * amplitude for i in range(size))
+
+def triangle(amplitude: float = 1., size: int = SIZE) -> array.array:
+    return _waveform((1 - 4 * abs(i / size - .5)) * MAX * amplitude for i in range(size))
+
+def noise(amplitude: float = 1., size: int = SIZE) -> array.array:
+    return _waveform(random.uniform(-1, 1) * MAX * amplitude for i in range(size))
+
+def mix(*waveforms) -> array.array:
+    # each waveform is either an array or a tuple of (array, level)
+    waveforms = [waveform if isinstance(waveform, tuple) else (waveform, 1.) for waveform in waveforms]
+    size = max(len(waveform) for waveform, level in waveforms)
+    return _waveform(
+        sum(waveform[i * len(waveform) // size] * level for waveform, level in waveforms)
+        for i in range(size)
+    )
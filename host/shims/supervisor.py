@@ -0,0 +1,35 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+# host stand-in for the CircuitPython `supervisor` module
+
+from host import runtime as _host
+
+class Runtime:
+    def __init__(self):
+        self.autoreload = True
+        self.display = None
+
+    @property
+    def serial_bytes_available(self) -> int:
+        return _host.session.inputs.serial.in_waiting
+
+    @property
+    def serial_connected(self) -> bool:
+        return True
+
+    @property
+    def usb_connected(self) -> bool:
+        return True
+
+runtime = Runtime()
+
+def ticks_ms() -> int:
+    return _host.session.clock.ticks_ms()
+
+def reload() -> None:
+    raise _host.Reload()
+
+def set_next_code_file(filename: str, **kwargs) -> None:
+    pass
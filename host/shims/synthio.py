@@ -0,0 +1,87 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+# host stand-in for the CircuitPython `synthio` module, notes are tracked but never rendered
+
+class Envelope:
+    def __init__(self, *, attack_time: float = 0.1, decay_time: float = 0.05, release_time: float = 0.2,
+                 attack_level: float = 1., sustain_level: float = 0.8):
+        self.attack_time = attack_time
+        self.decay_time = decay_time
+        self.release_time = release_time
+        self.attack_level = attack_level
+        self.sustain_level = sustain_level
+
+class LFO:
+    def __init__(self, waveform=None, *, rate: float = 1., scale: float = 1., offset: float = 0.,
+                 phase_offset: float = 0., once: bool = False, interpolate: bool = True):
+        self.waveform = waveform
+        self.rate = rate
+        self.scale = scale
+        self.offset = offset
+        self.phase_offset = phase_offset
+        self.once = once
+        self.interpolate = interpolate
+        self.phase = 0.
+        self.retriggers = 0
+
+    @property
+    def value(self) -> float:
+        return self.offset + self.scale
+
+    def retrigger(self) -> None:
+        self.phase = 0.
+        self.retriggers += 1
+
+class Note:
+    def __init__(self, frequency: float, *, panning: float = 0., waveform=None, envelope: Envelope = None,
+                 amplitude=1., bend=0., filter=None, ring_frequency: float = 0., ring_bend=0., ring_waveform=None):
+        self.frequency = frequency
+        self.panning = panning
+        self.waveform = waveform
+        self.envelope = envelope
+        self.amplitude = amplitude
+        self.bend = bend
+        self.filter = filter
+        self.ring_frequency = ring_frequency
+        self.ring_bend = ring_bend
+        self.ring_waveform = ring_waveform
+
+class Synthesizer:
+    def __init__(self, *, sample_rate: int = 11025, channel_count: int = 1, waveform=None, envelope: Envelope = None):
+        self.sample_rate = sample_rate
+        self.channel_count = channel_count
+        self.waveform = waveform
+        self.envelope = envelope
+        self.pressed = []
+        self.presses = 0
+
+    @staticmethod
+    def _notes(notes) -> list:
+        return list(notes) if isinstance(notes, (list, tuple)) else [notes]
+
+    def press(self, press=()) -> None:
+        for note in self._notes(press):
+            if note not in self.pressed:
+                self.pressed.append(note)
+            self.presses += 1
+
+    def release(self, release=()) -> None:
+        for note in self._notes(release):
+            if note in self.pressed:
+                self.pressed.remove(note)
+
+    def change(self, release=(), press=()) -> None:
+        self.release(release)
+        self.press(press)
+
+    def release_all(self) -> None:
+        self.pressed = []
+
+    def release_all_then_press(self, press=()) -> None:
+        self.release_all()
+        self.press(press)
+
+    def deinit(self) -> None:
+        self.release_all()
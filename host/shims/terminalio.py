@@ -0,0 +1,58 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+# host stand-in for the CircuitPython `terminalio` module
+
+import displayio
+
+GLYPH_WIDTH = 6
+GLYPH_HEIGHT = 12
+
+# 5x7 pixel glyphs of every printable character from " " to "~", five columns each with the top row
+# in the lowest bit, like the classic glcdfont
+GLYPHS = bytes.fromhex(
+    "0000000000" "00005f0000" "0007000700" "147f147f14" "242a7f2a12" "2313086462" "3649562050" "0005030000"
+    "001c224100" "0041221c00" "2a1c7f1c2a" "08083e0808" "0050300000" "0808080808" "0060600000" "2010080402"
+    "3e5149453e" "00427f4000" "4261514946" "2141454b31" "1814127f10" "2745454539" "3c4a494930" "0171090503"
+    "3649494936" "064949291e" "0036360000" "0056360000" "0814224100" "1414141414" "0041221408" "0201510906"
+    "324979413e" "7e1111117e" "7f49494936" "3e41414122" "7f4141221c" "7f49494941" "7f09090901" "3e4149497a"
+    "7f0808087f" "00417f4100" "2040413f01" "7f08142241" "7f40404040" "7f020c027f" "7f0408107f" "3e4141413e"
+    "7f09090906" "3e4151215e" "7f09192946" "4649494931" "01017f0101" "3f4040403f" "1f2040201f" "3f4038403f"
+    "6314081463" "0708700807" "6151494543" "007f414100" "0204081020" "0041417f00" "0402010204" "4040404040"
+    "0001020400" "2054545478" "7f48444438" "3844444420" "384444487f" "3854545418" "087e090102" "0c5252523e"
+    "7f08040478" "00447d4000" "2040443d00" "7f10284400" "00417f4000" "7c04180478" "7c08040478" "3844444438"
+    "7c14141408" "081414187c" "7c08040408" "4854545420" "043f444020" "3c4040207c" "1c2040201c" "3c4030403c"
+    "4428102844" "0c5050503c" "4464544c44" "0008364100" "00007f0000" "0041360800" "1008081008"
+)
+
+class Glyph:
+    def __init__(self, bitmap, tile_index: int, width: int, height: int, dx: int, dy: int, shift_x: int, shift_y: int):
+        self.bitmap = bitmap
+        self.tile_index = tile_index
+        self.width = width
+        self.height = height
+        self.dx = dx
+        self.dy = dy
+        self.shift_x = shift_x
+        self.shift_y = shift_y
+
+class BuiltinFont:
+    def __init__(self):
+        # a strip of glyph tiles for every printable character, like the real font
+        self.bitmap = displayio.Bitmap(GLYPH_WIDTH * 0x5f, GLYPH_HEIGHT, 2)
+        for i, column in enumerate(GLYPHS):
+            x = i // 5 * GLYPH_WIDTH + i % 5
+            for y in range(7):
+                if column >> y & 1:
+                    self.bitmap[x, y + 2] = 1
+
+    def get_bounding_box(self) -> tuple:
+        return (GLYPH_WIDTH, GLYPH_HEIGHT)
+
+    def get_glyph(self, codepoint: int) -> Glyph:
+        if not 0x20 <= codepoint < 0x7f:
+            return None
+        return Glyph(self.bitmap, codepoint - 0x20, GLYPH_WIDTH, GLYPH_HEIGHT, 0, 0, GLYPH_WIDTH, 0)
+
+FONT = BuiltinFont()
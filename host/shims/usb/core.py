@@ -0,0 +1,51 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+# host stand-in for `usb.core`, only the scripted keyboard of the host session is ever attached
+
+from host import runtime as _host
+
+class USBError(OSError):
+    pass
+
+class USBTimeoutError(USBError):
+    pass
+
+class Device:
+    # a boot protocol keyboard with a single interface and interrupt endpoint
+    idVendor = 0x1234
+    idProduct = 0x5678
+    manufacturer = "Host"
+    product = "Keyboard"
+
+    def __init__(self, keyboard: _host.KeyboardDevice):
+        self._keyboard = keyboard
+        self._kernel_driver = True
+
+    def set_configuration(self, configuration: int = None) -> None:
+        pass
+
+    def is_kernel_driver_active(self, interface: int) -> bool:
+        return self._kernel_driver
+
+    def detach_kernel_driver(self, interface: int) -> None:
+        self._kernel_driver = False
+
+    def read(self, endpoint: int, buffer, timeout: int = None) -> int:
+        keyboard = self._keyboard
+        if not keyboard.connected:
+            raise USBError("No device")
+        if not keyboard.reports:  # keyboards only report when a key changes
+            raise USBTimeoutError()
+        keyboard.reports = 0
+        buffer[0] = buffer[1] = 0
+        for i in range(6):
+            buffer[2 + i] = keyboard.keys[i] if i < len(keyboard.keys) else 0
+        return 8
+
+def find(find_all: bool = False, idVendor: int = None, idProduct: int = None):
+    devices = [Device(_host.session.inputs.keyboard)] if _host.session.inputs.keyboard.connected else []
+    if find_all:
+        return iter(devices)
+    return devices[0] if devices else None
@@ -0,0 +1,32 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+# host stand-in for the CircuitPython `vectorio` module
+
+class _Shape:
+    def __init__(self, pixel_shader, x: int, y: int, color_index: int):
+        self.pixel_shader = pixel_shader
+        self.x = x
+        self.y = y
+        self.color_index = color_index
+        self.hidden = False
+
+    @property
+    def location(self) -> tuple:
+        return (self.x, self.y)
+
+    @location.setter
+    def location(self, value: tuple) -> None:
+        self.x, self.y = value
+
+class Rectangle(_Shape):
+    def __init__(self, *, pixel_shader, width: int, height: int, x: int = 0, y: int = 0, color_index: int = 0):
+        super().__init__(pixel_shader, x, y, color_index)
+        self.width = width
+        self.height = height
+
+class Circle(_Shape):
+    def __init__(self, *, pixel_shader, radius: int, x: int = 0, y: int = 0, color_index: int = 0):
+        super().__init__(pixel_shader, x, y, color_index)
+        self.radius = radius
@@ -0,0 +1,86 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+import random
+
+from pong.physics import FIXED_SHIFT, BallPhysics
+
+def intercept(x: int, y: int, velocity_y: int, target_x: int, span: int) -> int:
+    # Closed form y position of the ball once it has traveled from x to target_x. The ball always
+    # moves as far on the y axis as it does on the x axis, so we can unfold its path through the
+    # walls into a straight line and then fold the result back into the playfield (0 to span).
+    y += velocity_y * abs(target_x - x)
+    y %= span * 2
+    return y if y <= span else span * 2 - y
+
+class Computer:
+    # Predicts where the ball will meet the paddle only when the ball's path changes (a serve or a
+    # bounce), rather than polling. Difficulty is tuned by how long it takes to react to a bounce and
+    # by how far off its prediction may be, which shrinks as the ball gets closer. Reaction times
+    # are counted in physics steps and every random draw is made from the gameplay task, so a
+    # replay with the same seed plays the computer exactly the same however the frames are timed.
+
+    def __init__(self, paddle, ball_physics: BallPhysics, width: int, height: int,
+                 min_reaction_time: float = .1, max_reaction_time: float = .4,
+                 error: int = 0, speed: int = 1, rate: int = 30):
+        self.paddle = paddle
+        self.ball_physics = ball_physics
+        self.width = width
+        self.height = height
+        self.min_reaction_steps = int(min_reaction_time * rate)
+        self.max_reaction_steps = int(max_reaction_time * rate)
+        self.error = error  # maximum prediction error in pixels when the ball is a full playfield away
+        self.speed = speed  # distance the paddle moves per step, used to stop without jittering
+
+        self.target = None  # paddle y position to move towards
+        self._due = -1  # physics step to predict at, -1 if nothing is pending
+        self._again = False  # the ball changed direction again while waiting to react
+
+    def reset(self) -> None:
+        # forget about any reaction still pending from the previous rally
+        self._due = -1
+        self._again = False
+
+    def notify(self, step: int) -> None:
+        # the ball has been served or has bounced
+        if self._due < 0:
+            self._due = step + self.reaction_steps()
+        else:
+            self._again = True
+
+    def reaction_steps(self) -> int:
+        return random.randint(self.min_reaction_steps, self.max_reaction_steps)
+
+    def update(self, step: int) -> None:
+        # predicts once the reaction time since the last change has passed
+        if self._due < 0 or step < self._due:
+            return
+        self.predict()
+        if self._again:  # react to the change which came in meanwhile
+            self._again = False
+            self._due = step + self.reaction_steps()
+        else:
+            self._due = -1
+
+    def predict(self) -> None:
+        ball = self.ball_physics
+        if ball.velocity_x < 0:  # head back to the center while the ball is moving away
+            self.target = (self.height - self.paddle.height) // 2
+            return
+
+        # the ball's right edge meets the paddle's left edge
+        target_x = (self.paddle.x - ball.rect.width) << FIXED_SHIFT
+        y = intercept(ball.x, ball.y, ball.velocity_y, target_x, (self.height - ball.rect.height) << FIXED_SHIFT) >> FIXED_SHIFT
+
+        # line up the center of the paddle with the center of the ball
+        y += (ball.rect.height - self.paddle.height) // 2
+        if self.error:
+            y += int(random.uniform(-1, 1) * self.error * (self.paddle.x - ball.rect.x) / self.width)
+        self.target = min(max(y, 0), self.height - self.paddle.height)
+
+    def direction(self) -> int:
+        # 1 to move up, -1 to move down, or 0 if the paddle is close enough to its target
+        if self.target is None or abs(self.target - self.paddle.y) < self.speed:
+            return 0
+        return 1 if self.target < self.paddle.y else -1
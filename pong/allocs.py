@@ -0,0 +1,62 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+import array
+import gc
+
+AVAILABLE = hasattr(gc, "mem_free")  # only on CircuitPython
+
+# parts of the gameplay frame
+TASKS = 0  # everything the other tasks did since the previous frame
+INPUT = 1
+PHYSICS = 2
+COMPUTER = 3
+RENDER = 4
+
+SECTIONS = ("tasks", "input", "physics", "computer", "render")  # indexed by the section
+
+class AllocationMonitor:
+    # Attributes heap allocations within each gameplay frame to the section of the frame which made
+    # them by how much `gc.mem_free()` drops between marks. Whatever the other tasks allocate
+    # between two frames is counted as `TASKS`. A mark where free memory went up instead means the
+    # garbage collector ran, so that interval is counted as a collection rather than an allocation.
+    # CPython has no `gc.mem_free`, run `python -m host.alloc` for a line by line report instead.
+
+    def __init__(self, sections: int = len(SECTIONS)):
+        self.frames = 0
+        self.collections = 0
+        self._bytes = array.array("L", [0] * sections)  # total allocated in each section
+        self._max = array.array("L", [0] * sections)  # most allocated between two marks
+        self._free = gc.mem_free()
+
+    def mark(self, section: int) -> None:
+        # everything allocated since the previous mark was allocated by `section`
+        free = gc.mem_free()
+        allocated = self._free - free
+        if allocated < 0:
+            self.collections += 1
+        elif allocated:
+            self._bytes[section] += allocated
+            if allocated > self._max[section]:
+                self._max[section] = allocated
+        self._free = gc.mem_free()  # leave out the int returned by the first call
+
+    def frame(self) -> None:
+        self.frames += 1
+
+    def reset(self) -> None:
+        self.frames = self.collections = 0
+        for i in range(len(self._bytes)):
+            self._bytes[i] = self._max[i] = 0
+
+    def report(self) -> None:
+        print("heap allocations per gameplay frame over {:d} frames, {:d} garbage collections".format(
+            self.frames, self.collections,
+        ))
+        print("{:10s} {:>10s} {:>10s}".format("section", "mean B", "max B"))
+        for section in sorted(range(len(self._bytes)), key=lambda i: -self._bytes[i]):
+            print("{:10s} {:10.1f} {:10d}".format(
+                SECTIONS[section] if section < len(SECTIONS) else str(section),
+                self._bytes[section] / max(self.frames, 1), self._max[section],
+            ))
@@ -0,0 +1,96 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+from pong.scheduler import ticks_diff
+
+# keys
+KEY_NONE = 0
+KEY_UP = 1
+KEY_DOWN = 2
+KEY_RIGHT = 3
+KEY_LEFT = 4
+KEY_ENTER = 5
+KEY_SPACE = 6
+KEY_ESCAPE = 7
+# printable characters other than space are returned as their ascii code, ie: ord("l")
+
+# parser states
+_GROUND = 0
+_ESCAPE = 1  # received ESC
+_CSI = 2  # received ESC [, reading parameters until the final byte
+_SS3 = 3  # received ESC O, the next byte is the final byte
+
+ESC = 0x1b
+
+class Parser:
+    # Incremental parser for the escape sequences which terminals send for the keys we care about.
+    # Bytes are fed in one at a time as they arrive so sequences may be split across reads and any
+    # number of keys may arrive in one read. A lone ESC is only reported as the escape key once
+    # `timeout` ms have passed without the rest of a sequence arriving. Sequences for other keys,
+    # including those with modifiers (ie: ESC [ 1 ; 5 A), are consumed and ignored.
+
+    def __init__(self, timeout: int = 100):
+        self.timeout = timeout
+        self._state = _GROUND
+        self._ticks = 0  # when ESC was received
+        self._parameters = False  # whether the current CSI sequence has parameters
+
+    def _final(self, byte: int) -> int:
+        self._state = _GROUND
+        if self._parameters:
+            return KEY_NONE
+        if byte == 0x41:  # A
+            return KEY_UP
+        if byte == 0x42:  # B
+            return KEY_DOWN
+        if byte == 0x43:  # C
+            return KEY_RIGHT
+        if byte == 0x44:  # D
+            return KEY_LEFT
+        return KEY_NONE
+
+    def _feed(self, byte: int, now: int) -> int:
+        if self._state == _GROUND:
+            if byte == ESC:
+                self._state = _ESCAPE
+                self._ticks = now
+            elif byte == 0x0a or byte == 0x0d:  # line feed or carriage return
+                return KEY_ENTER
+            elif byte == 0x20:
+                return KEY_SPACE
+            elif 0x20 < byte < 0x7f:
+                return byte
+        elif self._state == _ESCAPE:
+            if byte == 0x5b:  # [
+                self._state = _CSI
+                self._parameters = False
+            elif byte == 0x4f:  # O
+                self._state = _SS3
+                self._parameters = False
+            elif byte == ESC:  # the previous ESC was on its own
+                self._ticks = now
+                return KEY_ESCAPE
+            else:  # alt + key
+                self._state = _GROUND
+        elif self._state == _CSI:
+            if 0x40 <= byte <= 0x7e:
+                return self._final(byte)
+            elif 0x20 <= byte <= 0x3f:  # parameter and intermediate bytes
+                self._parameters = True
+            else:  # malformed sequence
+                self._state = _GROUND
+        else:  # _SS3
+            return self._final(byte)
+        return KEY_NONE
+
+    def feed(self, byte: int, now: int) -> int:
+        # returns the key completed by this byte, if any
+        return self._feed(byte, now)
+
+    def expire(self, now: int) -> int:
+        # returns the escape key if an ESC has been waiting on its own for long enough
+        if self._state == _ESCAPE and ticks_diff(now, self._ticks) >= self.timeout:
+            self._state = _GROUND
+            return KEY_ESCAPE
+        return KEY_NONE
@@ -0,0 +1,206 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+import array
+import asyncio
+import audiocore
+import supervisor
+import time
+
+from pong.scheduler import ticks_diff
+
+# sound effects
+SFX_WALL = 0
+SFX_PADDLE = 1
+SFX_SCORE = 2
+
+# higher priority sounds can steal a voice from lower or equal priority sounds, never the other way around
+PRIORITIES = (0, 1, 2)
+
+def render(waveform: array.array, frequency: float, duration: float, sample_rate: int,
+           amplitude: float = 1, attack_time: float = .01) -> audiocore.RawSample:
+    # Renders a gated note just like the synthio backend plays it: the waveform is stepped through
+    # at the note frequency without interpolation, with a linear attack and a hard stop at the end
+    # of the duration.
+    length = int(duration * sample_rate)
+    attack = max(int(attack_time * sample_rate), 1)
+    step = frequency * len(waveform) / sample_rate
+    buffer = array.array("h", [0] * length)
+    for i in range(length):
+        value = waveform[int(i * step) % len(waveform)] * amplitude
+        if i < attack:
+            value = value * i / attack
+        buffer[i] = int(value)
+    return audiocore.RawSample(buffer, channel_count=1, sample_rate=sample_rate)
+
+class _Backend:
+    def __init__(self, voices: int):
+        self.voices = voices
+        self.triggers = 0
+        self.trigger_ns = 0  # total time spent inside `_start`, not counting the wait in the queue
+
+    def start(self, voice: int, sfx: int) -> None:
+        started = time.monotonic_ns()
+        self._start(voice, sfx)
+        self.trigger_ns += time.monotonic_ns() - started
+        self.triggers += 1
+
+    def stop(self, voice: int) -> None:
+        self._stop(voice)
+
+class SynthBackend(_Backend):
+    # renders the notes live with the synthesizer, `notes` holds a tuple of every sound effect's
+    # note for each voice so that the same effect can overlap itself
+    def __init__(self, synth, notes: tuple):
+        super().__init__(len(notes))
+        self.synth = synth
+        self.notes = notes
+        self._pressed = [None] * self.voices
+
+    def _start(self, voice: int, sfx: int) -> None:
+        if self._pressed[voice] is not None:
+            self.synth.release(self._pressed[voice])
+        note = self._pressed[voice] = self.notes[voice][sfx]
+        note.amplitude.retrigger()  # make sure we reset our amplitude lfo
+        self.synth.press(note)
+
+    def _stop(self, voice: int) -> None:
+        if self._pressed[voice] is not None:
+            self.synth.release(self._pressed[voice])
+            self._pressed[voice] = None
+
+class SampleBackend(_Backend):
+    # plays sound effects which have been rendered ahead of time, one mixer voice per voice
+    def __init__(self, mixer, samples: tuple):
+        super().__init__(len(mixer.voice))
+        self.mixer = mixer
+        self.samples = samples
+
+    def _start(self, voice: int, sfx: int) -> None:
+        self.mixer.voice[voice].play(self.samples[sfx])  # replaces whatever this voice was playing
+
+    def _stop(self, voice: int) -> None:
+        self.mixer.voice[voice].stop()
+
+class Scheduler:
+    # Gameplay posts sound effects to a small ring buffer which never blocks or allocates, and the
+    # scheduler task starts them once the frame has yielded. Each sound gets a free voice if there
+    # is one, otherwise it steals the lowest priority voice that is the oldest, as long as that
+    # voice isn't playing something more important. When the queue is full, new sounds are dropped.
+    # The delay from each sound being posted to its voice being started is kept for `report`.
+
+    def __init__(self, backend: _Backend, durations: tuple, size: int = 8):
+        self.backend = backend
+        self.durations = tuple(int(duration * 1000) for duration in durations)  # in ms
+        self.posted = 0
+        self.dropped = 0  # sounds which didn't fit into the queue or couldn't get a voice
+        self.stolen = 0
+
+        self.delay_ms = 0  # total time from post to start of the sounds which were started
+        self.max_delay_ms = 0
+
+        self._queue = array.array("b", [0] * size)
+        self._posted = array.array("L", [0] * size)  # ticks each queued sound was posted at
+        self._head = 0
+        self._count = 0
+        self._ready = asyncio.Event()
+
+        # what each voice is playing, -1 when it is free
+        self._sfx = array.array("b", [-1] * backend.voices)
+        self._started = array.array("L", [0] * backend.voices)
+
+    def post(self, sfx: int) -> bool:
+        if self._count == len(self._queue):
+            self.dropped += 1
+            return False
+        i = (self._head + self._count) % len(self._queue)
+        self._queue[i] = sfx
+        self._posted[i] = supervisor.ticks_ms()
+        self._count += 1
+        self.posted += 1
+        self._ready.set()
+        return True
+
+    def _voice(self, sfx: int, now: int) -> int:
+        best = -1
+        for i in range(self.backend.voices):
+            playing = self._sfx[i]
+            if playing < 0 or ticks_diff(now, self._started[i]) >= self.durations[playing]:
+                return i  # free voice
+            if PRIORITIES[playing] > PRIORITIES[sfx]:
+                continue
+            if best < 0 or PRIORITIES[playing] < PRIORITIES[self._sfx[best]] or (
+                PRIORITIES[playing] == PRIORITIES[self._sfx[best]]
+                and ticks_diff(self._started[i], self._started[best]) < 0
+            ):
+                best = i
+        if best >= 0:
+            self.stolen += 1
+        return best
+
+    def _drain(self) -> None:
+        now = supervisor.ticks_ms()
+        while self._count:
+            sfx = self._queue[self._head]
+            posted = self._posted[self._head]
+            self._head = (self._head + 1) % len(self._queue)
+            self._count -= 1
+
+            voice = self._voice(sfx, now)
+            if voice < 0:
+                self.dropped += 1
+                continue
+            self._sfx[voice] = sfx
+            self._started[voice] = now
+            self.backend.start(voice, sfx)
+
+            delay = ticks_diff(supervisor.ticks_ms(), posted)
+            self.delay_ms += delay
+            if delay > self.max_delay_ms:
+                self.max_delay_ms = delay
+
+    def _spin(self, ms: int) -> int:
+        # runs a busy loop for the given time, returning how many times it went around
+        count = 0
+        end = time.monotonic_ns() + ms * 1000000
+        while time.monotonic_ns() < end:
+            count += 1
+        return count
+
+    def load(self, ms: int = 200) -> float:
+        # The synthesizer and mixer render in the background audio task, which the time spent in
+        # `start` never sees. Instead, a busy loop is run in silence and then with every voice
+        # playing the longest sound effect, and the share of loops lost while playing is returned.
+        # This blocks for twice `ms`, which should be shorter than the longest sound effect.
+        sfx = self.durations.index(max(self.durations))
+        for voice in range(self.backend.voices):
+            self.backend.stop(voice)
+            self._sfx[voice] = -1
+        silent = self._spin(ms)
+        for voice in range(self.backend.voices):
+            self.backend._start(voice, sfx)  # left out of the trigger counts
+        playing = self._spin(ms)
+        for voice in range(self.backend.voices):
+            self.backend.stop(voice)
+        return 1 - playing / max(silent, 1)
+
+    def report(self) -> None:
+        load = self.load()
+        started = self.backend.triggers
+        print("sound effects: {:d} posted, {:d} started, {:d} dropped, {:d} voices stolen".format(
+            self.posted, started, self.dropped, self.stolen,
+        ))
+        print("post->start {:.1f} ms avg {:d} ms max, starting a voice {:.0f} us avg".format(
+            self.delay_ms / max(started, 1), self.max_delay_ms,
+            self.backend.trigger_ns / max(started, 1) / 1000,
+        ))
+        print("rendering {:d} voices in the background takes {:.1f}% of the CPU".format(
+            self.backend.voices, load * 100,
+        ))
+
+    async def run(self) -> None:
+        while True:
+            await self._ready.wait()
+            self._ready.clear()
+            self._drain()
@@ -0,0 +1,44 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+import keypad
+
+class Buttons:
+    # Hardware buttons scanned and debounced in the background by `keypad`. Every update drains the
+    # queued events, so a press which is released again before the next update is still reported
+    # in `pressed`. Chords are given as bit masks of key numbers and are detected on the press
+    # which completes them rather than by reading every button at once.
+
+    def __init__(self, keys: keypad.Keys, chords: tuple = ()):
+        self.keys = keys
+        self.chords = chords
+        self.held = 0  # bit mask of the buttons which are currently down
+        self.pressed = 0  # buttons which went down since the last update
+        self.chorded = 0  # bit mask of the chords completed since the last update
+        self._event = keypad.Event()
+
+    def update(self) -> bool:
+        # returns whether any button is down or was pressed
+        self.pressed = self.chorded = 0
+        while self.keys.events.get_into(self._event):
+            mask = 1 << self._event.key_number
+            if self._event.pressed:
+                self.held |= mask
+                self.pressed |= mask
+                for i in range(len(self.chords)):
+                    if self.held & self.chords[i] == self.chords[i]:
+                        self.chorded |= 1 << i
+            else:
+                self.held &= ~mask
+        if self.keys.events.overflowed:  # lost track of the buttons
+            self.keys.events.clear()
+            self.held = 0
+        return bool(self.held or self.pressed)
+
+    def active(self, key: int) -> bool:
+        # whether the button is down or was tapped since the last update
+        return bool((self.held | self.pressed) & (1 << key))
+
+    def chord(self, index: int) -> bool:
+        return bool(self.chorded & (1 << index))
@@ -0,0 +1,54 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+import asyncio
+
+class Gamepads:
+    # Reading and discovery of gamepads are kept apart. `update` is called on every input poll and
+    # only reads from gamepads which are connected, draining every report which has queued up since
+    # the last poll so that the buttons reflect the latest state. `discover` runs in its own task and
+    # looks for the gamepads which aren't connected, backing off exponentially while none turn up
+    # and starting over as soon as one is lost.
+
+    def __init__(self, gamepads: list, max_reports: int = 8, min_interval: float = .1, max_interval: float = .5):
+        self.gamepads = gamepads
+        self.max_reports = max_reports  # most reports to read from one gamepad per poll
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._lost = asyncio.Event()
+        self._lost.set()  # nothing has been found yet
+
+    def update(self) -> bool:
+        # returns whether any gamepad is connected
+        connected = False
+        for gamepad in self.gamepads:
+            if not gamepad.connected:
+                continue
+            for i in range(self.max_reports):
+                if not gamepad.update():  # no more reports or disconnected
+                    break
+            if gamepad.connected:
+                connected = True
+            else:
+                self._lost.set()
+        return connected
+
+    async def discover(self) -> None:
+        interval = self.min_interval
+        while True:
+            if all(gamepad.connected for gamepad in self.gamepads):
+                # wait until a gamepad is unplugged
+                self._lost.clear()
+                await self._lost.wait()
+                interval = self.min_interval
+
+            # updating a gamepad which isn't connected looks for its device
+            found = False
+            for gamepad in self.gamepads:
+                if not gamepad.connected:
+                    gamepad.update()
+                    found = found or gamepad.connected
+
+            interval = self.min_interval if found else min(interval * 2, self.max_interval)
+            await asyncio.sleep(interval)
@@ -0,0 +1,83 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+import array
+import asyncio
+import supervisor
+
+from pong.scheduler import TICKS_MAX, ticks_diff
+
+# input sources
+KEYBOARD = 0
+GAMEPAD = 1
+MOUSE = 2
+BUTTONS = 3
+
+# input actions
+MOVE = 0  # value is the direction, 1 for up or -1 for down
+POSITION = 1  # value is the y position of the paddle
+CONTINUE = 2
+EXIT = 3
+CONNECT = 4  # value is 1 when the player's gamepad has been found or 0 when it's been lost
+NONE = 15  # padding used within recordings
+
+class Intents:
+    # Where each player wants their paddle to go, gathered from every input source between
+    # physics frames and applied once per frame. A position overrides any movement and the most
+    # recent movement direction wins, so holding a direction on two devices doesn't move the
+    # paddle twice as fast.
+
+    def __init__(self, players: int = 2):
+        self.direction = array.array("b", [0] * players)
+        self.target = array.array("h", [-1] * players)  # -1 when there is no position
+
+    def move(self, player: int, direction: int) -> None:
+        self.direction[player] = 1 if direction > 0 else -1
+
+    def position(self, player: int, y: int) -> None:
+        self.target[player] = y
+
+    def clear(self) -> None:
+        for i in range(len(self.direction)):
+            self.direction[i] = 0
+            self.target[i] = -1
+
+class Multiplexer:
+    # Polls every input source from a single task. Each poller is called at its own rate and
+    # returns whether its device is present. A poller which finds nothing backs off, doubling its
+    # interval up to that of `idle_rate`, and returns to full rate as soon as its device shows up.
+    # Pollers which are due together are run in one wakeup in the order they were added.
+
+    def __init__(self):
+        self._pollers = []
+        self._intervals = array.array("H")  # ms at full rate
+        self._idle_intervals = array.array("H")
+        self._current = array.array("H")  # ms, including backoff
+        self._due = array.array("L")  # ticks
+
+    def add(self, poll, rate: float, idle_rate: float = None) -> None:
+        interval = max(int(1000 / rate), 1)
+        self._pollers.append(poll)
+        self._intervals.append(interval)
+        # keep the idle interval a multiple of the full rate so that pollers stay in step with each other
+        self._idle_intervals.append(interval * max(round(1000 / idle_rate / interval), 1) if idle_rate else interval)
+        self._current.append(interval)
+        self._due.append(supervisor.ticks_ms())
+
+    def _poll(self, now: int) -> int:
+        # runs every poller which is due and returns the ms until the next one
+        wait = 1000
+        for i in range(len(self._pollers)):
+            if ticks_diff(self._due[i], now) <= 0:
+                if self._pollers[i]():
+                    self._current[i] = self._intervals[i]
+                else:
+                    self._current[i] = min(self._current[i] * 2, self._idle_intervals[i])
+                self._due[i] = (now + self._current[i]) & TICKS_MAX
+            wait = min(wait, ticks_diff(self._due[i], now))
+        return wait
+
+    async def run(self) -> None:
+        while True:
+            await asyncio.sleep(max(self._poll(supervisor.ticks_ms()), 1) / 1000)
@@ -0,0 +1,76 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+# USB host boot protocol keyboard. Unlike the serial console, the keyboard reports every key which
+# is held down, so the paddle can move on every frame from the moment a key is pressed instead of
+# waiting on the terminal's key repeat.
+
+import adafruit_usb_host_descriptors
+import usb.core
+
+# usb hid usage ids
+KEY_A = 0x04
+KEY_D = 0x07
+KEY_S = 0x16
+KEY_W = 0x1a
+KEY_ENTER = 0x28
+KEY_ESCAPE = 0x29
+KEY_SPACE = 0x2c
+KEY_RIGHT = 0x4f
+KEY_LEFT = 0x50
+KEY_DOWN = 0x51
+KEY_UP = 0x52
+
+_ERROR_ROLLOVER = 0x01  # reported in every key slot when too many keys are held
+
+class BootKeyboard:
+    def __init__(self, device, endpoint: int, interface: int = 0):
+        self.device = device
+        self.endpoint = endpoint
+        self.interface = interface
+        self.modifiers = 0
+        self._report = bytearray(8)  # modifiers, reserved, then up to 6 held keys
+        self._held = bytearray(32)  # bitmap of all 256 usage ids
+        self._previous = bytearray(32)
+
+    def update(self) -> bool:
+        # reads the latest report, returns False once the keyboard has been disconnected
+        self._previous[:] = self._held
+        try:
+            count = self.device.read(self.endpoint, self._report, timeout=1)
+        except usb.core.USBTimeoutError:  # no keys have changed
+            return True
+        except usb.core.USBError:
+            return False
+        if count < 8 or self._report[2] == _ERROR_ROLLOVER:
+            return True  # keep the previous state
+
+        self.modifiers = self._report[0]
+        for i in range(len(self._held)):
+            self._held[i] = 0
+        for i in range(2, 8):
+            if key := self._report[i]:
+                self._held[key >> 3] |= 1 << (key & 7)
+        return True
+
+    def held(self, key: int) -> bool:
+        return bool(self._held[key >> 3] & (1 << (key & 7)))
+
+    def pressed(self, key: int) -> bool:
+        # whether the key went down during the last update
+        return self.held(key) and not self._previous[key >> 3] & (1 << (key & 7))
+
+def find_and_init_boot_keyboard() -> BootKeyboard:
+    for device in usb.core.find(find_all=True):
+        interface, endpoint = adafruit_usb_host_descriptors.find_boot_keyboard_endpoint(device)
+        if interface is None or endpoint is None:
+            continue
+        try:
+            device.set_configuration()
+            if device.is_kernel_driver_active(interface):
+                device.detach_kernel_driver(interface)
+        except usb.core.USBError:
+            continue
+        return BootKeyboard(device, endpoint, interface)
+    return None
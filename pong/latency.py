@@ -0,0 +1,85 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+import array
+
+from pong.scheduler import ticks_diff
+
+SOURCES = ("keyboard", "gamepad", "mouse", "buttons")  # indexed by the input source
+BUCKET = 2  # ms per histogram bucket
+BUCKETS = 64  # the last bucket also holds everything slower
+
+class LatencyMonitor:
+    # Follows paddle input from the moment it's read by the input poller, through the physics step
+    # which moves the paddle, to the end of the frame it's drawn in. For each source only the
+    # oldest input which hasn't been applied yet is timed, since later inputs are coalesced into
+    # the same paddle movement. Latencies are kept in fixed histograms per source for both stages.
+
+    def __init__(self, sources: int = len(SOURCES)):
+        self._read = array.array("l", [-1] * sources)  # ticks of the oldest pending input
+        self._applied = array.array("l", [-1] * sources)  # ticks it was read, once it's been applied
+        self._to_paddle = array.array("H", [0] * (sources * BUCKETS))
+        self._to_frame = array.array("H", [0] * (sources * BUCKETS))
+
+    def read(self, source: int, now: int) -> None:
+        if self._read[source] < 0:
+            self._read[source] = now
+
+    @staticmethod
+    def _add(histogram: array.array, source: int, latency: int) -> None:
+        i = source * BUCKETS + min(max(latency, 0) // BUCKET, BUCKETS - 1)
+        if histogram[i] < 0xffff:
+            histogram[i] += 1
+
+    def applied(self, now: int) -> None:
+        # paddles have been moved by every pending input
+        for source in range(len(self._read)):
+            if (read := self._read[source]) >= 0:
+                self._add(self._to_paddle, source, ticks_diff(now, read))
+                if self._applied[source] < 0:
+                    self._applied[source] = read
+                self._read[source] = -1
+
+    def shown(self, now: int) -> None:
+        # a frame with the moved paddles has been drawn
+        for source in range(len(self._applied)):
+            if (read := self._applied[source]) >= 0:
+                self._add(self._to_frame, source, ticks_diff(now, read))
+                self._applied[source] = -1
+
+    def reset(self) -> None:
+        for i in range(len(self._to_paddle)):
+            self._to_paddle[i] = self._to_frame[i] = 0
+
+    @staticmethod
+    def _summary(histogram: array.array, source: int) -> tuple:
+        # returns (count, p50, p95, max) in ms, the percentiles are the upper edge of their bucket
+        offset = source * BUCKETS
+        count = sum(histogram[offset:offset + BUCKETS])
+        p50 = p95 = top = 0
+        total = 0
+        for i in range(BUCKETS):
+            if not (n := histogram[offset + i]):
+                continue
+            total += n
+            if not p50 and total * 2 >= count:
+                p50 = (i + 1) * BUCKET
+            if not p95 and total * 20 >= count * 19:
+                p95 = (i + 1) * BUCKET
+            top = (i + 1) * BUCKET
+        return (count, p50, p95, top)
+
+    def report(self) -> None:
+        print("input latency in ms, measured while the ball is in play ({:d} means {:d} or more)".format(
+            BUCKETS * BUCKET, BUCKETS * BUCKET,
+        ))
+        print("{:10s} {:>14s} {:>6s} {:>6s} {:>6s} {:>14s} {:>6s} {:>6s} {:>6s}".format(
+            "source", "input->paddle", "p50", "p95", "max", "input->frame", "p50", "p95", "max",
+        ))
+        for source in range(len(self._read)):
+            print("{:10s} {:14d} {:6d} {:6d} {:6d} {:14d} {:6d} {:6d} {:6d}".format(
+                SOURCES[source] if source < len(SOURCES) else str(source),
+                *self._summary(self._to_paddle, source),
+                *self._summary(self._to_frame, source),
+            ))
@@ -0,0 +1,66 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+import array
+import usb.core
+
+import adafruit_usb_host_mouse
+
+BUTTON_LEFT = 0x01
+BUTTON_RIGHT = 0x02
+BUTTON_MIDDLE = 0x04
+
+class Mouse:
+    # Reads boot protocol reports straight from the mouse found by `adafruit_usb_host_mouse`
+    # instead of moving its cursor. Every report queued since the last update is read and their
+    # vertical motion is added up, then an acceleration curve is applied to the total so that slow
+    # movements stay precise while fast ones cover the whole playfield:
+    #   motion = dy * sensitivity * (1 + acceleration * |dy|)
+    # A failed read means that the mouse has been unplugged, so it is dropped right away.
+
+    def __init__(self, sensitivity: float = 1, acceleration: float = .125, max_reports: int = 8,
+                 cursor_image: str = "bitmaps/cursor.bmp"):
+        self.sensitivity = int(sensitivity * 16)  # in 1/16ths to keep the math in integers
+        self.acceleration = int(acceleration * 16)
+        self.max_reports = max_reports
+        self.cursor_image = cursor_image  # never shown, but required to set up the mouse
+        self.mouse = None
+        self.buttons = 0  # bit mask of the buttons which are down
+        self.clicked = 0  # buttons which went down during the last update
+        self.motion = 0  # accelerated vertical motion in pixels during the last update
+        self._report = array.array("b", [0] * 4)
+
+    @property
+    def connected(self) -> bool:
+        return self.mouse is not None
+
+    def find(self) -> bool:
+        self.mouse = adafruit_usb_host_mouse.find_and_init_boot_mouse(self.cursor_image)
+        self.buttons = 0
+        return self.mouse is not None
+
+    def update(self) -> bool:
+        # returns False if the mouse isn't connected
+        if self.mouse is None and not self.find():
+            return False
+
+        previous, dy = self.buttons, 0
+        for i in range(self.max_reports):
+            try:
+                count = self.mouse.device.read(self.mouse.endpoint, self._report, timeout=1)
+            except usb.core.USBTimeoutError:  # nothing more to read
+                break
+            except usb.core.USBError:  # unplugged
+                self.mouse = None
+                self.buttons = self.clicked = self.motion = 0
+                return False
+            if count >= 3:
+                self.buttons = self._report[0] & 0x07
+                dy += self._report[2]
+
+        self.clicked = self.buttons & ~previous
+        # curve the magnitude so that floor division treats both directions alike
+        motion = abs(dy) * self.sensitivity * (16 + self.acceleration * abs(dy)) // 256
+        self.motion = -motion if dy < 0 else motion
+        return True
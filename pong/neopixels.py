@@ -0,0 +1,85 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+import array
+import supervisor
+
+from pong.scheduler import ticks_diff
+
+def apply_brightness(value:int, brightness:float) -> int:
+    for i in range(3):
+        c = (value >> (8 * i)) & 0xff  # extract color component (rgb)
+        c = int(c * brightness)  # apply brightness
+        c = min(max(c, 0x00), 0xff)  # clamp value to acceptable range
+        value &= 0xffffff ^ (0xff << (8 * i))  # remove old component value
+        value |= c << (8 * i)  # insert new component value
+    return value
+
+class NeoPixelRenderer:
+    # Lights up the pixels nearest to the ball. The color of every pixel is precomputed for each of
+    # `steps` positions between neighboring pixels, so rendering is just a table lookup. Only the
+    # pixels which have changed are written, with auto write turned off so that the strip is shown
+    # once per update and not at all if nothing changed, since `show()` blocks while the data is
+    # shifted out.
+
+    def __init__(self, pixels, color: int, width: int, steps: int = 16):
+        self.pixels = pixels
+        pixels.auto_write = False  # otherwise every pixel written is shown on its own
+        self.width = width  # width of the playfield
+        self.positions = (pixels.n - 1) * steps + 1
+        self.enabled = True
+
+        # colors of every pixel for each quantized position
+        self._lut = array.array("L", [0] * (self.positions * pixels.n))
+        for position in range(self.positions):
+            for i in range(pixels.n):
+                diff = abs(position / steps - i)  # distance from ball position to pixel index
+                self._lut[position * pixels.n + i] = apply_brightness(color, 1 - diff) if diff < 1 else 0
+
+        self._shown = array.array("L", [0] * pixels.n)  # current colors of the strip
+        self._position = None
+
+    def _write(self, offset: int) -> None:
+        changed = False
+        for i in range(self.pixels.n):
+            color = self._lut[offset + i] if offset >= 0 else 0
+            if color != self._shown[i]:
+                self.pixels[i] = self._shown[i] = color
+                changed = True
+        if changed:
+            self.pixels.show()
+
+    def render(self, x: int) -> None:
+        # quantize the ball's x position on the playfield
+        position = min(max(x * (self.positions - 1) // self.width, 0), self.positions - 1)
+        if position != self._position:
+            self._position = position
+            self._write(position * self.pixels.n)
+
+    def clear(self) -> None:
+        self._position = None
+        self._write(-1)
+
+class Snapshot:
+    # The last two ball positions published by the gameplay task. Reading the position
+    # interpolates between them one frame behind, so a renderer running at a different rate than
+    # the physics still moves smoothly.
+
+    def __init__(self, x: int = 0):
+        self.reset(x)
+
+    def reset(self, x: int) -> None:
+        self._previous_x = self._x = x
+        self._previous_ticks = self._ticks = supervisor.ticks_ms()
+
+    def update(self, x: int) -> None:
+        self._previous_x, self._previous_ticks = self._x, self._ticks
+        self._x, self._ticks = x, supervisor.ticks_ms()
+
+    def position(self) -> int:
+        interval = ticks_diff(self._ticks, self._previous_ticks)
+        if interval <= 0:
+            return self._x
+        elapsed = min(max(ticks_diff(supervisor.ticks_ms(), self._ticks), 0), interval)
+        return self._previous_x + (self._x - self._previous_x) * elapsed // interval
@@ -0,0 +1,101 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+# fixed-point values use 8 fractional bits so that ball state can be stored in small integers
+# which CircuitPython doesn't need to allocate on the heap, unlike floats
+FIXED_SHIFT = 8
+FIXED_ONE = 1 << FIXED_SHIFT
+
+# events returned by BallPhysics.step
+HIT_PADDLE = 1
+HIT_WALL = 2
+
+def to_fixed(value: float) -> int:
+    return int(value * FIXED_ONE)
+
+def sweep_fixed(x: int, y: int, dx: int, dy: int, width: int, height: int, rect) -> int:
+    # Find the time of impact of a box at (x, y) of the given size moving by (dx, dy) against a
+    # rectangle, or -1 if they don't meet during this movement. The rectangle is grown by the size
+    # of the box so that we only have to trace the path of the box's top-left corner, and touching
+    # edges count as a hit. Positions and movement are fixed-point but the rectangle and box size
+    # are in whole pixels, the time of impact is returned as a fixed-point fraction (0 to FIXED_ONE).
+    left, right = (rect.x - width) << FIXED_SHIFT, (rect.x + rect.width) << FIXED_SHIFT
+    top, bottom = (rect.y - height) << FIXED_SHIFT, (rect.y + rect.height) << FIXED_SHIFT
+
+    if dx > 0:
+        enter, leave = ((left - x) << FIXED_SHIFT) // dx, ((right - x) << FIXED_SHIFT) // dx
+    elif dx < 0:
+        enter, leave = ((right - x) << FIXED_SHIFT) // dx, ((left - x) << FIXED_SHIFT) // dx
+    elif left <= x <= right:
+        enter, leave = 0, FIXED_ONE
+    else:
+        return -1
+
+    if dy > 0:
+        enter, leave = max(enter, ((top - y) << FIXED_SHIFT) // dy), min(leave, ((bottom - y) << FIXED_SHIFT) // dy)
+    elif dy < 0:
+        enter, leave = max(enter, ((bottom - y) << FIXED_SHIFT) // dy), min(leave, ((top - y) << FIXED_SHIFT) // dy)
+    elif not top <= y <= bottom:
+        return -1
+
+    if enter > leave or enter > FIXED_ONE or leave < 0:
+        return -1
+    return max(enter, 0)
+
+class BallPhysics:
+    # Ball position and speed kept in fixed-point so that a physics step only does integer math.
+    # The display rectangle is updated with the whole pixel position after every step.
+
+    def __init__(self, rect, height: int, initial_speed: float, speed_modifier: float, max_speed: float):
+        self.rect = rect
+        self.height = height  # height of the playfield
+        self.initial_speed = to_fixed(initial_speed)
+        self.speed_modifier = to_fixed(speed_modifier)
+        self.max_speed = to_fixed(max_speed)
+
+        self.x = rect.x << FIXED_SHIFT
+        self.y = rect.y << FIXED_SHIFT
+        self.velocity_x = self.velocity_y = 1  # direction on each axis, either -1 or 1
+        self.speed = self.initial_speed
+
+    def reset(self, x: int, y: int, velocity: tuple) -> None:
+        self.x, self.y = x << FIXED_SHIFT, y << FIXED_SHIFT
+        self.rect.x, self.rect.y = x, y
+        self.velocity_x, self.velocity_y = velocity
+        self.speed = self.initial_speed
+
+    def step(self, paddles: list) -> int:
+        events = 0
+        dx, dy = self.velocity_x * self.speed, self.velocity_y * self.speed
+
+        # trace the path of the ball against the paddle it's heading towards
+        impact = sweep_fixed(
+            self.x, self.y, dx, dy, self.rect.width, self.rect.height,
+            paddles[1 if self.velocity_x > 0 else 0],
+        )
+        if impact >= 0:
+            # move the ball up to the point of impact
+            self.x += (dx * impact) >> FIXED_SHIFT
+            self.y += (dy * impact) >> FIXED_SHIFT
+
+            self.velocity_x = -self.velocity_x  # invert x velocity
+            self.speed = min((self.speed * self.speed_modifier) >> FIXED_SHIFT, self.max_speed)  # increase ball speed by modifier
+            events |= HIT_PADDLE
+
+            # use up the rest of this step with the new velocity
+            remaining = FIXED_ONE - impact
+            dx = (self.velocity_x * self.speed * remaining) >> FIXED_SHIFT
+            dy = (self.velocity_y * self.speed * remaining) >> FIXED_SHIFT
+
+        # apply velocity to ball position
+        self.x += dx
+        self.y += dy
+        self.rect.x, self.rect.y = self.x >> FIXED_SHIFT, self.y >> FIXED_SHIFT
+
+        # only check if we've hit the bottom if y velocity is positive and if we've hit the top if y velocity is negative
+        if (self.velocity_y < 0 and self.rect.y <= 0) or (self.velocity_y > 0 and self.rect.y + self.rect.height >= self.height):
+            self.velocity_y = -self.velocity_y  # invert y velocity
+            events |= HIT_WALL
+
+        return events
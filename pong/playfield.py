@@ -0,0 +1,134 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+# The center line, paddles and ball are all plain rectangles. Each playfield backend hands out
+# rectangles with the same `x`, `y`, `width`, `height` and `hidden` attributes as
+# `vectorio.Rectangle`, so the rest of the game doesn't need to know which one is in use.
+
+import array
+import bitmaptools
+import displayio
+import vectorio
+
+class VectorioPlayfield:
+    # every rectangle is its own vectorio shape and displayio tracks the area of each one
+    def __init__(self, group: displayio.Group, width: int, height: int, color: int):
+        self.group = group
+        self.width = width
+        self.height = height
+        self.palette = displayio.Palette(1)
+        self.palette[0] = color
+        self.rectangles = []
+
+    def rectangle(self, x: int, y: int, width: int, height: int) -> vectorio.Rectangle:
+        rectangle = vectorio.Rectangle(pixel_shader=self.palette, width=width, height=height, x=x, y=y)
+        self.group.append(rectangle)
+        self.rectangles.append(rectangle)
+        return rectangle
+
+    def draw(self) -> None:
+        pass
+
+class Rectangle:
+    # a rectangle drawn into the playfield bitmap, changes are only drawn by `BitmapPlayfield.draw`
+    def __init__(self, x: int, y: int, width: int, height: int):
+        self._x, self._y = x, y
+        self.width = width
+        self.height = height
+        self._hidden = False
+        self._dirty = True
+        self._drawn = False  # whether the area below is in the bitmap
+        self._x1 = self._y1 = self._x2 = self._y2 = 0
+
+    @property
+    def x(self) -> int:
+        return self._x
+
+    @x.setter
+    def x(self, value: int) -> None:
+        if value != self._x:
+            self._x = value
+            self._dirty = True
+
+    @property
+    def y(self) -> int:
+        return self._y
+
+    @y.setter
+    def y(self, value: int) -> None:
+        if value != self._y:
+            self._y = value
+            self._dirty = True
+
+    @property
+    def hidden(self) -> bool:
+        return self._hidden
+
+    @hidden.setter
+    def hidden(self, value: bool) -> None:
+        if value != self._hidden:
+            self._hidden = value
+            self._dirty = True
+
+class BitmapPlayfield:
+    # Every rectangle is drawn into a single bitmap with `bitmaptools.fill_region`. Moving a
+    # rectangle erases the area it was drawn in and redraws whatever else overlapped that area (ie:
+    # the center line under the ball), so only the changed pixels are touched. Note that displayio
+    # tracks a single dirty area per bitmap which covers all of the changes made between refreshes.
+
+    def __init__(self, group: displayio.Group, width: int, height: int, color: int, max_rectangles: int = 8):
+        self.width = width
+        self.height = height
+        self.bitmap = displayio.Bitmap(width, height, 2)
+        self.palette = displayio.Palette(2)
+        self.palette[0] = 0x000000
+        self.palette[1] = color
+        group.append(displayio.TileGrid(self.bitmap, pixel_shader=self.palette))
+        self.rectangles = []
+        self._erased = array.array("h", [0] * (max_rectangles * 4))  # x1, y1, x2, y2 of each erased area
+
+    def rectangle(self, x: int, y: int, width: int, height: int) -> Rectangle:
+        if len(self.rectangles) * 4 >= len(self._erased):
+            raise ValueError("Too many rectangles")
+        rectangle = Rectangle(x, y, width, height)
+        self.rectangles.append(rectangle)
+        return rectangle
+
+    def _fill(self, x1: int, y1: int, x2: int, y2: int, value: int) -> None:
+        # clips to the bitmap
+        x1, y1 = max(x1, 0), max(y1, 0)
+        x2, y2 = min(x2, self.width), min(y2, self.height)
+        if x1 < x2 and y1 < y2:
+            bitmaptools.fill_region(self.bitmap, x1, y1, x2, y2, value)
+
+    def draw(self) -> None:
+        # erase every rectangle which has changed
+        erased = 0
+        for rectangle in self.rectangles:
+            if rectangle._dirty and rectangle._drawn:
+                self._fill(rectangle._x1, rectangle._y1, rectangle._x2, rectangle._y2, 0)
+                self._erased[erased] = rectangle._x1
+                self._erased[erased + 1] = rectangle._y1
+                self._erased[erased + 2] = rectangle._x2
+                self._erased[erased + 3] = rectangle._y2
+                erased += 4
+                rectangle._drawn = False
+
+        for rectangle in self.rectangles:
+            if rectangle._dirty:
+                # draw the rectangle where it is now
+                rectangle._dirty = False
+                if not rectangle._hidden:
+                    rectangle._x1, rectangle._y1 = rectangle._x, rectangle._y
+                    rectangle._x2, rectangle._y2 = rectangle._x + rectangle.width, rectangle._y + rectangle.height
+                    self._fill(rectangle._x1, rectangle._y1, rectangle._x2, rectangle._y2, 1)
+                    rectangle._drawn = True
+            elif rectangle._drawn:
+                # redraw any part of the rectangle which was erased
+                for i in range(0, erased, 4):
+                    self._fill(
+                        max(rectangle._x1, self._erased[i]), max(rectangle._y1, self._erased[i + 1]),
+                        min(rectangle._x2, self._erased[i + 2]), min(rectangle._y2, self._erased[i + 3]),
+                        1,
+                    )
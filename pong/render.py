@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+import asyncio
+import time
+
+class Renderer:
+    # Takes over display refreshes from auto refresh so that a frame is only ever drawn once all of
+    # its changes have been made. While the ball is in play, the gameplay task owns the display and
+    # draws every frame itself with `frame`. The rest of the time, anything which changes the
+    # display calls `invalidate` and the `run` task draws it, at most `rate` times per second.
+
+    def __init__(self, display, rate: int = 30, playfield=None):
+        self.display = display
+        self.rate = rate
+        self.playfield = playfield  # drawn right before each refresh
+        self.owned = False  # whether the gameplay task is drawing every frame
+        self.refreshes = 0
+        self.dropped = 0  # physics frames which were never drawn
+        self.refresh_ns = 0  # total time spent refreshing
+        self.max_refresh_ns = 0
+        self._dirty = asyncio.Event()
+        self._dirty.set()  # draw the initial state
+        display.auto_refresh = False
+
+    def invalidate(self) -> None:
+        if not self.owned:
+            self._dirty.set()
+
+    def refresh(self) -> None:
+        # The frame scheduler already paces frames, so the display is refreshed right away. Passing
+        # `target_frames_per_second` would have the display skip frames which arrive a millisecond
+        # late and block the event loop to wait out the rest of its frame time.
+        started = time.monotonic_ns()
+        if self.playfield is not None:
+            self.playfield.draw()
+        self.display.refresh()
+        elapsed = time.monotonic_ns() - started
+        self.refreshes += 1
+        self.refresh_ns += elapsed
+        self.max_refresh_ns = max(self.max_refresh_ns, elapsed)
+
+    def frame(self, steps: int = 1) -> None:
+        # draws the result of `steps` physics steps, all but the last of which are never seen
+        self.refresh()
+        self.dropped += steps - 1
+
+    async def run(self) -> None:
+        while True:
+            await self._dirty.wait()
+            self._dirty.clear()
+            if not self.owned:
+                self.refresh()
+            await asyncio.sleep(1 / self.rate)
+
+    def report(self) -> None:
+        print("{:d} refreshes, {:d} dropped frames, {:.2f}ms average and {:.2f}ms max refresh time".format(
+            self.refreshes, self.dropped,
+            self.refresh_ns / max(self.refreshes, 1) / 1000000, self.max_refresh_ns / 1000000,
+        ))
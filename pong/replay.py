@@ -0,0 +1,135 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+# Input recordings are a small header followed by 3 unsigned 16-bit words per event:
+#   frames since the previous event, source << 8 | player << 4 | action, value
+# Events are buffered within a preallocated array which is appended to the file between rallies,
+# or once it fills up while the ball isn't in play. While `hold` is set, a full buffer drops events
+# instead so that the filesystem is never written to mid-frame. The recordings of the previous few
+# boots are kept alongside as `<path>.1`, `<path>.2` and so on.
+
+import array
+import os
+import random
+import struct
+
+from pong import inputs
+
+MAGIC = b"PONG"
+VERSION = 3  # gamepad connections are recorded and the computer reacts in physics steps
+HEADER = "<4sHI"  # magic, version, random seed
+HEADER_SIZE = struct.calcsize(HEADER)
+EVENT_SIZE = 3  # words per event
+MAX_DELTA = 0xffff
+
+class Recorder:
+    def __init__(self, scheduler, path: str = None, seed: int = None, buffer_size: int = 2048, keep: int = 3):
+        self.scheduler = scheduler  # provides the current frame as `steps`
+        self.path = path
+        self.seed = seed if seed is not None else random.getrandbits(30)
+        self.events = 0
+        self.dropped = 0  # events which didn't fit while held, the recording can't be replayed past them
+        self.hold = False  # whether the buffer may be written out when it's full
+        self._buffer = array.array("H", [0] * (buffer_size * EVENT_SIZE))
+        self._length = 0
+        self._frame = 0
+
+        # use the same seed for the ball and the computer player when replaying
+        random.seed(self.seed)
+
+        if self.path is not None:
+            self._rotate(keep)
+            try:
+                with open(self.path, "wb") as f:
+                    f.write(struct.pack(HEADER, MAGIC, VERSION, self.seed))
+            except OSError:  # read-only filesystem, keep going without saving
+                self.path = None
+
+    def _rotate(self, keep: int) -> None:
+        # shifts the previous recordings along so that restarting doesn't overwrite the last one
+        for i in range(keep, 0, -1):
+            source = self.path if i == 1 else "{:s}.{:d}".format(self.path, i - 1)
+            destination = "{:s}.{:d}".format(self.path, i)
+            try:
+                os.remove(destination)
+            except OSError:
+                pass
+            try:
+                os.rename(source, destination)
+            except OSError:  # nothing to keep yet, or a read-only filesystem
+                pass
+
+    def _append(self, delta: int, packed: int, value: int) -> bool:
+        if self._length >= len(self._buffer):
+            if self.hold:
+                self.dropped += 1
+                return False
+            self.flush()
+        self._buffer[self._length] = delta
+        self._buffer[self._length + 1] = packed
+        self._buffer[self._length + 2] = value & 0xffff
+        self._length += EVENT_SIZE
+        return True
+
+    def record(self, source: int, action: int, value: int = 0, player: int = 0) -> None:
+        frame = self.scheduler.steps
+        delta = frame - self._frame
+        while delta > MAX_DELTA:  # pad out long gaps between events
+            if not self._append(MAX_DELTA, inputs.NONE, 0):
+                return
+            delta -= MAX_DELTA
+            self._frame += MAX_DELTA
+        if self._append(delta, (source << 8) | (player << 4) | action, value):
+            self._frame = frame
+            self.events += 1
+
+    def flush(self) -> None:
+        if self.path is not None and self._length:
+            try:
+                with open(self.path, "ab") as f:
+                    f.write(memoryview(self._buffer)[:self._length])
+            except OSError:
+                self.path = None
+        self._length = 0
+
+    def report(self) -> None:
+        print("{:d} inputs recorded to {}, {:d} dropped while the buffer was full".format(
+            self.events, self.path, self.dropped,
+        ))
+
+class Player:
+    def __init__(self, scheduler, path: str):
+        self.scheduler = scheduler
+        with open(path, "rb") as f:
+            magic, version, self.seed = struct.unpack(HEADER, f.read(HEADER_SIZE))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError("Invalid recording")
+            self._events = array.array("H", [0] * ((os.stat(path)[6] - HEADER_SIZE) // 2))
+            f.readinto(self._events)
+        self._index = 0
+        self._frame = self._events[0] if self._events else 0
+
+        random.seed(self.seed)
+
+    @property
+    def finished(self) -> bool:
+        return self._index >= len(self._events)
+
+    @property
+    def action(self) -> int:
+        # action of the next event
+        return self._events[self._index + 1] & 0x0f
+
+    def due(self, frame: int = None) -> bool:
+        # whether the next event was recorded at or before the given physics step, or the current one
+        return not self.finished and self._frame <= (self.scheduler.steps if frame is None else frame)
+
+    def pop(self) -> tuple:
+        # returns the next event as (source, action, value, player)
+        packed, value = self._events[self._index + 1], self._events[self._index + 2]
+        self._index += EVENT_SIZE
+        if not self.finished:
+            self._frame += self._events[self._index]
+        value = value - 0x10000 if value & 0x8000 else value
+        return (packed >> 8, packed & 0x0f, value, (packed >> 4) & 0x0f)
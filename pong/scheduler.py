@@ -0,0 +1,67 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+import asyncio
+import supervisor
+
+# supervisor.ticks_ms() wraps around every 2**29 milliseconds
+TICKS_PERIOD = 1 << 29
+TICKS_MAX = TICKS_PERIOD - 1
+TICKS_HALFPERIOD = TICKS_PERIOD // 2
+
+def ticks_diff(a: int, b: int) -> int:
+    # signed difference between two tick values which is safe across wraparound
+    diff = (a - b) & TICKS_MAX
+    return ((diff + TICKS_HALFPERIOD) & TICKS_MAX) - TICKS_HALFPERIOD
+
+class FrameScheduler:
+    # Fixed timestep frame pacing. Elapsed time is accumulated in units of 1/rate milliseconds so
+    # that rates which don't divide evenly into a second (ie: 30 Hz) never drift. Each call to
+    # `wait` returns the number of physics steps which are due, catching up by at most `max_steps`
+    # steps and dropping the rest.
+
+    def __init__(self, rate: int = 30, max_steps: int = 4):
+        self.rate = rate
+        self.max_steps = max_steps
+
+        self.steps = 0  # physics steps run
+        self.late = 0  # frames where we had to catch up on more than one step
+        self.missed = 0  # frames where more steps were due than could be caught up on
+        self.dropped = 0  # steps skipped altogether
+
+        self.reset()
+
+    def reset(self) -> None:
+        # start timing from now, ie: after the game has been paused
+        self._last = supervisor.ticks_ms()
+        self._accumulator = 0
+
+    def _update(self) -> int:
+        now = supervisor.ticks_ms()
+        self._accumulator += max(ticks_diff(now, self._last), 0) * self.rate
+        self._last = now
+        return self._accumulator // 1000
+
+    async def wait(self) -> int:
+        while not (steps := self._update()):
+            # sleep for the remainder of the current step rounded up to the next whole tick
+            await asyncio.sleep(((1000 - self._accumulator + self.rate - 1) // self.rate) / 1000)
+
+        if steps > self.max_steps:
+            self.missed += 1
+            self.dropped += steps - self.max_steps
+            steps = self.max_steps
+            self._accumulator %= 1000  # keep the fractional step for a deterministic phase
+        else:
+            self._accumulator -= steps * 1000
+        if steps > 1:
+            self.late += 1
+
+        self.steps += steps
+        return steps
+
+    def report(self) -> None:
+        print("{:d} physics steps, {:d} late frames, {:d} missed frames with {:d} steps skipped".format(
+            self.steps, self.late, self.missed, self.dropped,
+        ))
@@ -0,0 +1,89 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+import displayio
+
+BLANK = 10  # tile index of the empty tile after the digits 0-9
+
+# segments lit for each digit as bits: top, upper right, lower right, bottom, lower left, upper left, middle
+SEGMENTS = (0b0111111, 0b0000110, 0b1011011, 0b1001111, 0b1100110, 0b1101101, 0b1111101, 0b0000111, 0b1111111, 0b1101111)
+
+def _fill(bitmap: displayio.Bitmap, x: int, y: int, width: int, height: int) -> None:
+    for j in range(y, y + height):
+        for i in range(x, x + width):
+            bitmap[i, j] = 1
+
+def segment_sheet(tile_width: int, tile_height: int, thickness: int) -> displayio.Bitmap:
+    # draws each digit from blocky segments like the arcade machine did, with a column of spacing
+    # on the right of each tile
+    bitmap = displayio.Bitmap(tile_width * (BLANK + 1), tile_height, 2)
+    w, h, t = tile_width - thickness, tile_height, thickness
+    middle = (h - t) // 2
+    for digit in range(BLANK):
+        x, segments = digit * tile_width, SEGMENTS[digit]
+        if segments & 0b0000001:  # top
+            _fill(bitmap, x, 0, w, t)
+        if segments & 0b0000010:  # upper right
+            _fill(bitmap, x + w - t, 0, t, middle + t)
+        if segments & 0b0000100:  # lower right
+            _fill(bitmap, x + w - t, middle, t, h - middle)
+        if segments & 0b0001000:  # bottom
+            _fill(bitmap, x, h - t, w, t)
+        if segments & 0b0010000:  # lower left
+            _fill(bitmap, x, middle, t, h - middle)
+        if segments & 0b0100000:  # upper left
+            _fill(bitmap, x, 0, t, middle + t)
+        if segments & 0b1000000:  # middle
+            _fill(bitmap, x, middle, w, t)
+    return bitmap
+
+def font_sheet(font, scale: int = 1) -> displayio.Bitmap:
+    # copies the glyphs of the digits out of a bitmap font such as `terminalio.FONT`, scaled up
+    tile_width, tile_height = font.get_bounding_box()[:2]
+    bitmap = displayio.Bitmap(tile_width * scale * (BLANK + 1), tile_height * scale, 2)
+    for digit in range(BLANK):
+        glyph = font.get_glyph(ord("0") + digit)
+        for y in range(glyph.height):
+            for x in range(glyph.width):
+                if glyph.bitmap[glyph.tile_index * glyph.width + x, y]:
+                    _fill(bitmap, (digit * tile_width + x) * scale, y * scale, scale, scale)
+    return bitmap
+
+class ScoreDisplay:
+    # Shows a score of up to `digits` digits horizontally centered on `x` by picking tiles from a
+    # shared sheet of pre-rendered digits, so changing the score never lays out text or allocates.
+
+    def __init__(self, sheet: displayio.Bitmap, palette: displayio.Palette, x: int, y: int, digits: int = 2):
+        self.tile_width = sheet.width // (BLANK + 1)
+        self.digits = digits
+        self.center = x
+        self.tilegrid = displayio.TileGrid(
+            sheet, pixel_shader=palette,
+            width=digits, height=1,
+            tile_width=self.tile_width, tile_height=sheet.height,
+            default_tile=BLANK, y=y,
+        )
+        self._value = -1
+        self.show(0)
+
+    def show(self, value: int) -> bool:
+        # returns whether anything changed
+        value = min(max(value, 0), 10 ** self.digits - 1)
+        if value == self._value:
+            return False
+        self._value = value
+
+        # fill in the digits from the right and blank out the leading zeros
+        count = 0
+        for i in range(self.digits - 1, -1, -1):
+            if value or not count:
+                self.tilegrid[i] = value % 10
+                value //= 10
+                count += 1
+            else:
+                self.tilegrid[i] = BLANK
+
+        # center the digits which are showing
+        self.tilegrid.x = self.center - self.tile_width * self.digits + self.tile_width * count // 2
+        return True
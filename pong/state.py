@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: 2025 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+import asyncio
+
+# game states
+ATTRACT = 0  # waiting for a player to start the game
+SERVE = 1  # ball is being reset to the center
+RALLY = 2  # ball is in play
+POINT = 3  # ball has gone out of bounds
+WIN = 4  # a player has won, waiting for a player to continue
+
+NAMES = ("attract", "serve", "rally", "point", "win")
+
+class GameState:
+    # Each state has an event which is set only while the game is in that state, so tasks can
+    # sleep until the state they care about comes around instead of polling for it.
+
+    def __init__(self):
+        self.state = ATTRACT
+        self.scores = [0, 0]
+        self._events = tuple(asyncio.Event() for i in range(len(NAMES)))
+        self._events[self.state].set()
+
+    def set(self, state: int) -> None:
+        self._events[self.state].clear()
+        self.state = state
+        self._events[state].set()
+
+    async def wait(self, state: int) -> None:
+        await self._events[state].wait()
+
+    @property
+    def waiting(self) -> bool:
+        # whether the game is waiting for a player to continue
+        return self.state == ATTRACT or self.state == WIN
+
+    def point(self, player: int) -> int:
+        # returns the player's new score
+        self.scores[player] += 1
+        return self.scores[player]
+
+    def reset_scores(self) -> None:
+        for i in range(len(self.scores)):
+            self.scores[i] = 0
+
+    def resume(self) -> bool:
+        # published by the input tasks when a player presses start or continue
+        if not self.waiting:
+            return False
+        self.set(SERVE)
+        return True